@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+import shutil
+import tarfile
+import tempfile
+
+from ansible.errors import AnsibleActionFail, AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+
+MODULE_NAME = 'vanduc2514.wsl_automation.wsl_sync'
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(root, checksum):
+    """Describe every directory and file below root, keyed by relative POSIX path."""
+    manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            relative_path = os.path.relpath(path, root).replace(os.sep, '/')
+
+            # Broken symlinks and special files are not synchronized
+            if os.path.isdir(path):
+                manifest[relative_path] = dict(
+                    type='directory',
+                    size=0,
+                    mtime=int(os.stat(path).st_mtime),
+                    checksum=None,
+                )
+            elif os.path.isfile(path):
+                stat = os.stat(path)
+                manifest[relative_path] = dict(
+                    type='file',
+                    size=stat.st_size,
+                    mtime=int(stat.st_mtime),
+                    checksum=_sha256(path) if checksum else None,
+                )
+    return manifest
+
+
+def _reset_owner(tarinfo):
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = 'root'
+    return tarinfo
+
+
+def build_archive(root, entries, archive_path):
+    """Write the given relative paths below root into a single tar archive."""
+    with tarfile.open(archive_path, 'w', format=tarfile.GNU_FORMAT, dereference=True) as archive:
+        for relative_path in entries:
+            path = os.path.join(root, *relative_path.split('/'))
+            archive.add(path, arcname=relative_path, recursive=False, filter=_reset_owner)
+
+
+class ActionModule(ActionBase):
+
+    TRANSFERS_FILES = True
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module_args = self._task.args.copy()
+
+        # The source lives on the Windows host, the module does everything there
+        if boolean(module_args.get('remote_src', False), strict=False):
+            result.update(self._execute_module(module_name=MODULE_NAME, module_args=module_args, task_vars=task_vars))
+            return result
+
+        src = module_args.get('src')
+        if not src:
+            raise AnsibleActionFail("src is required")
+
+        try:
+            src = self._find_needle('files', src)
+        except AnsibleError as e:
+            raise AnsibleActionFail(to_native(e))
+
+        if not os.path.isdir(src):
+            raise AnsibleActionFail("src '%s' must be a directory" % src)
+
+        checksum = boolean(module_args.get('checksum', True), strict=False)
+        manifest = build_manifest(src, checksum)
+
+        # First pass only compares the manifests inside the distribution
+        plan_args = dict(module_args, _manifest=manifest)
+        plan = self._execute_module(module_name=MODULE_NAME, module_args=plan_args, task_vars=task_vars)
+        if plan.get('failed'):
+            result.update(plan)
+            return result
+
+        apply_args = dict(module_args, _transfer=plan['transfer'], _remove=plan['remove'])
+        local_tmp = None
+        try:
+            if plan['transfer'] and not self._task.check_mode:
+                local_tmp = tempfile.mkdtemp()
+                archive_path = os.path.join(local_tmp, 'wsl_sync.tar')
+                build_archive(src, plan['transfer'], archive_path)
+
+                remote_archive = self._connection._shell.join_path(self._connection._shell.tmpdir, 'wsl_sync.tar')
+                self._transfer_file(archive_path, remote_archive)
+                apply_args['_archive'] = remote_archive
+
+            result.update(self._execute_module(module_name=MODULE_NAME, module_args=apply_args, task_vars=task_vars))
+        finally:
+            if local_tmp:
+                shutil.rmtree(local_tmp, ignore_errors=True)
+            self._remove_tmp_path(self._connection._shell.tmpdir)
+
+        return result
@@ -0,0 +1,595 @@
+using System;
+using System.ComponentModel;
+using System.Diagnostics;
+using System.IO;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading;
+
+namespace ansible_collections.vanduc2514.wsl_automation.plugins.module_utils.WSLProcess
+{
+    public class WSLProcessResult
+    {
+        public int ExitCode { get; internal set; }
+        public string Stdout { get; internal set; }
+        public string Stderr { get; internal set; }
+        public bool StdoutTruncated { get; internal set; }
+        public bool StderrTruncated { get; internal set; }
+        public bool TimedOut { get; internal set; }
+    }
+
+    /// <summary>
+    /// Runs wsl.exe with redirected standard streams. wsl.exe writes its own messages in
+    /// UTF-16LE while commands inside a distribution write UTF-8. The caller tells which one
+    /// the output is, it cannot be told from the bytes as a distribution may print NULs.
+    /// </summary>
+    public class WSLProcessRunner : IDisposable
+    {
+        // Overridden to run a stand-in executable when testing outside Windows
+        public static string Executable = "wsl.exe";
+
+        private const int DrainTimeoutMilliseconds = 5000;
+
+        private readonly Process _process;
+        private readonly int _timeoutSeconds;
+        private readonly long _maxOutputBytes;
+        private readonly Encoding _encoding;
+        private OutputCapture _stdout;
+        private OutputCopy _stdoutCopy;
+        private OutputCapture _stderr;
+        private InputStream _stdin;
+        private Timer _timer;
+        private volatile bool _timedOut;
+
+        public WSLProcessRunner(string arguments, int timeoutSeconds, long maxOutputBytes, bool distributionOutput)
+        {
+            _timeoutSeconds = timeoutSeconds;
+            _maxOutputBytes = maxOutputBytes;
+
+            // The byte order mark flags only provide the preamble which is skipped when present
+            _encoding = distributionOutput ? (Encoding)new UTF8Encoding(true) : new UnicodeEncoding(false, true);
+
+            _process = new Process();
+            _process.StartInfo.FileName = Executable;
+            _process.StartInfo.Arguments = arguments;
+            _process.StartInfo.UseShellExecute = false;
+            _process.StartInfo.CreateNoWindow = true;
+            _process.StartInfo.RedirectStandardInput = true;
+            _process.StartInfo.RedirectStandardOutput = true;
+            _process.StartInfo.RedirectStandardError = true;
+
+            // WSL_UTF8 makes wsl.exe write its own messages about a distribution command in
+            // UTF-8 as well, management commands are always read as UTF-16LE
+            if (distributionOutput)
+            {
+                _process.StartInfo.EnvironmentVariables["WSL_UTF8"] = "1";
+            }
+            else
+            {
+                _process.StartInfo.EnvironmentVariables.Remove("WSL_UTF8");
+            }
+        }
+
+        public Stream StandardInput
+        {
+            get { return _stdin; }
+        }
+
+        // When set before Start, stdout is copied to this stream as is instead of being decoded
+        public Stream OutputSink { get; set; }
+
+        public void Start()
+        {
+            _process.Start();
+
+            _stdin = new InputStream(_process.StandardInput.BaseStream);
+            if (OutputSink != null)
+            {
+                _stdoutCopy = new OutputCopy(_process.StandardOutput.BaseStream, OutputSink, Terminate);
+            }
+            else
+            {
+                _stdout = new OutputCapture(_process.StandardOutput.BaseStream, _maxOutputBytes, _encoding);
+            }
+            _stderr = new OutputCapture(_process.StandardError.BaseStream, _maxOutputBytes, _encoding);
+
+            if (_timeoutSeconds > 0)
+            {
+                _timer = new Timer(Kill, null, _timeoutSeconds * 1000, Timeout.Infinite);
+            }
+        }
+
+        public WSLProcessResult Wait()
+        {
+            _stdin.Close();
+            _process.WaitForExit();
+
+            if (_timer != null)
+            {
+                _timer.Dispose();
+            }
+
+            // Children of a killed process may still hold the output pipes open
+            int drainTimeout = _timedOut ? DrainTimeoutMilliseconds : Timeout.Infinite;
+            _stderr.Join(drainTimeout);
+            if (_stdoutCopy != null)
+            {
+                _stdoutCopy.Join(drainTimeout);
+                if (_stdoutCopy.Error != null && !_timedOut)
+                {
+                    throw new IOException("Failed to write the output of wsl.exe: " + _stdoutCopy.Error.Message, _stdoutCopy.Error);
+                }
+            }
+            else
+            {
+                _stdout.Join(drainTimeout);
+            }
+
+            return new WSLProcessResult
+            {
+                ExitCode = _process.ExitCode,
+                Stdout = _stdout != null ? _stdout.Text : String.Empty,
+                Stderr = _stderr.Text,
+                StdoutTruncated = _stdout != null && _stdout.Truncated,
+                StderrTruncated = _stderr.Truncated,
+                TimedOut = _timedOut,
+            };
+        }
+
+        public void Dispose()
+        {
+            if (_timer != null)
+            {
+                _timer.Dispose();
+            }
+            _process.Dispose();
+        }
+
+        public static WSLProcessResult Run(string arguments, byte[] input, int timeoutSeconds, long maxOutputBytes, bool distributionOutput)
+        {
+            using (WSLProcessRunner runner = new WSLProcessRunner(arguments, timeoutSeconds, maxOutputBytes, distributionOutput))
+            {
+                runner.Start();
+                if (input != null)
+                {
+                    runner.StandardInput.Write(input, 0, input.Length);
+                }
+                return runner.Wait();
+            }
+        }
+
+        private void Kill(object state)
+        {
+            try
+            {
+                if (!_process.HasExited)
+                {
+                    _timedOut = true;
+                    Terminate();
+                }
+            }
+            catch (InvalidOperationException) { }
+        }
+
+        private void Terminate()
+        {
+            try
+            {
+                if (!_process.HasExited)
+                {
+                    _process.Kill();
+                }
+            }
+            catch (InvalidOperationException) { }
+            catch (Win32Exception) { }
+        }
+    }
+
+    /// <summary>
+    /// Standard input of the process. Once the process stops reading, further input is
+    /// discarded instead of failing the writer, the exit code tells what happened.
+    /// </summary>
+    public class InputStream : Stream
+    {
+        private readonly Stream _stream;
+        private bool _broken;
+        private bool _closed;
+
+        public InputStream(Stream stream)
+        {
+            _stream = stream;
+        }
+
+        public override bool CanRead { get { return false; } }
+        public override bool CanSeek { get { return false; } }
+        public override bool CanWrite { get { return !_closed; } }
+        public override long Length { get { throw new NotSupportedException(); } }
+
+        public override long Position
+        {
+            get { throw new NotSupportedException(); }
+            set { throw new NotSupportedException(); }
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            if (_broken || _closed)
+            {
+                return;
+            }
+
+            try
+            {
+                _stream.Write(buffer, offset, count);
+            }
+            catch (IOException)
+            {
+                _broken = true;
+            }
+        }
+
+        public override void Flush()
+        {
+            if (_broken || _closed)
+            {
+                return;
+            }
+
+            try
+            {
+                _stream.Flush();
+            }
+            catch (IOException)
+            {
+                _broken = true;
+            }
+        }
+
+        public override int Read(byte[] buffer, int offset, int count) { throw new NotSupportedException(); }
+        public override long Seek(long offset, SeekOrigin origin) { throw new NotSupportedException(); }
+        public override void SetLength(long value) { throw new NotSupportedException(); }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing && !_closed)
+            {
+                Flush();
+                _closed = true;
+                try
+                {
+                    _stream.Dispose();
+                }
+                catch (IOException) { }
+            }
+            base.Dispose(disposing);
+        }
+    }
+
+    /// <summary>
+    /// Reads an output stream on a background thread and decodes it as it arrives. Bytes
+    /// past the size limit are read and dropped so the process never blocks on a full pipe.
+    /// </summary>
+    public class OutputCapture
+    {
+        private readonly Stream _stream;
+        private readonly long _maxBytes;
+        private readonly Encoding _encoding;
+        private readonly StringBuilder _text = new StringBuilder();
+        private readonly Thread _thread;
+        private readonly object _lock = new object();
+        private MemoryStream _pending = new MemoryStream();
+        private Decoder _decoder;
+        private long _captured;
+        private bool _truncated;
+
+        public OutputCapture(Stream stream, long maxBytes, Encoding encoding)
+        {
+            _stream = stream;
+            _maxBytes = maxBytes;
+            _encoding = encoding;
+            _thread = new Thread(Read);
+            _thread.IsBackground = true;
+            _thread.Start();
+        }
+
+        public string Text
+        {
+            get { lock (_lock) { return _text.ToString(); } }
+        }
+
+        public bool Truncated
+        {
+            get { lock (_lock) { return _truncated; } }
+        }
+
+        public void Join(int timeout)
+        {
+            _thread.Join(timeout);
+        }
+
+        private void Read()
+        {
+            byte[] buffer = new byte[65536];
+            try
+            {
+                int read;
+                while ((read = _stream.Read(buffer, 0, buffer.Length)) > 0)
+                {
+                    int take = read;
+                    if (_maxBytes > 0 && _captured + take > _maxBytes)
+                    {
+                        take = (int)Math.Max(0, _maxBytes - _captured);
+                        lock (_lock) { _truncated = true; }
+                    }
+
+                    if (take > 0)
+                    {
+                        _captured += take;
+                        Decode(buffer, take, false);
+                    }
+                }
+            }
+            catch (IOException) { }
+            catch (ObjectDisposedException) { }
+
+            Decode(buffer, 0, true);
+        }
+
+        private void Decode(byte[] buffer, int count, bool flush)
+        {
+            int offset = 0;
+            if (_decoder == null)
+            {
+                // The preamble is only skipped, decoders keep it as a character
+                byte[] preamble = _encoding.GetPreamble();
+                _pending.Write(buffer, 0, count);
+                if (_pending.Length < preamble.Length && !flush)
+                {
+                    return;
+                }
+
+                buffer = _pending.ToArray();
+                count = buffer.Length;
+                _pending = null;
+
+                if (count >= preamble.Length)
+                {
+                    offset = preamble.Length;
+                    for (int i = 0; i < preamble.Length; i++)
+                    {
+                        if (buffer[i] != preamble[i])
+                        {
+                            offset = 0;
+                            break;
+                        }
+                    }
+                }
+                _decoder = _encoding.GetDecoder();
+            }
+
+            char[] chars = new char[_decoder.GetCharCount(buffer, offset, count - offset, flush)];
+            int decoded = _decoder.GetChars(buffer, offset, count - offset, chars, 0, flush);
+            lock (_lock)
+            {
+                _text.Append(chars, 0, decoded);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Copies an output stream as is to a sink on a background thread. When the sink fails,
+    /// the producer is stopped so it does not keep writing into a pipe nobody reads.
+    /// </summary>
+    public class OutputCopy
+    {
+        private readonly Stream _stream;
+        private readonly Stream _sink;
+        private readonly Action _onError;
+        private readonly Thread _thread;
+
+        public OutputCopy(Stream stream, Stream sink, Action onError)
+        {
+            _stream = stream;
+            _sink = sink;
+            _onError = onError;
+            _thread = new Thread(Copy);
+            _thread.IsBackground = true;
+            _thread.Start();
+        }
+
+        public Exception Error { get; private set; }
+
+        public void Join(int timeout)
+        {
+            _thread.Join(timeout);
+        }
+
+        private void Copy()
+        {
+            byte[] buffer = new byte[1048576];
+            try
+            {
+                int read;
+                while ((read = _stream.Read(buffer, 0, buffer.Length)) > 0)
+                {
+                    _sink.Write(buffer, 0, read);
+                }
+            }
+            catch (Exception e)
+            {
+                Error = e;
+                _onError();
+            }
+        }
+    }
+
+    /// <summary>
+    /// Computes a checksum of the bytes written through it. The checksum is available once
+    /// the stream is closed.
+    /// </summary>
+    public class HashingStream : Stream
+    {
+        private readonly Stream _stream;
+        private readonly HashAlgorithm _algorithm;
+        private long _length;
+        private string _hash;
+
+        public HashingStream(Stream stream, HashAlgorithm algorithm)
+        {
+            _stream = stream;
+            _algorithm = algorithm;
+        }
+
+        public string Hash
+        {
+            get { return _hash; }
+        }
+
+        public override bool CanRead { get { return false; } }
+        public override bool CanSeek { get { return false; } }
+        public override bool CanWrite { get { return _hash == null; } }
+        public override long Length { get { return _length; } }
+
+        public override long Position
+        {
+            get { return _length; }
+            set { throw new NotSupportedException(); }
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            _algorithm.TransformBlock(buffer, offset, count, null, 0);
+            _stream.Write(buffer, offset, count);
+            _length += count;
+        }
+
+        public override void Flush()
+        {
+            _stream.Flush();
+        }
+
+        public override int Read(byte[] buffer, int offset, int count) { throw new NotSupportedException(); }
+        public override long Seek(long offset, SeekOrigin origin) { throw new NotSupportedException(); }
+        public override void SetLength(long value) { throw new NotSupportedException(); }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing && _hash == null)
+            {
+                _algorithm.TransformFinalBlock(new byte[0], 0, 0);
+                _hash = BitConverter.ToString(_algorithm.Hash).Replace("-", "").ToLowerInvariant();
+                _algorithm.Clear();
+                _stream.Dispose();
+            }
+            base.Dispose(disposing);
+        }
+    }
+
+    /// <summary>
+    /// Pipes the bytes written through it into an external compressor like zstd, whose
+    /// output is written to the inner stream. Closing the stream waits for the compressor
+    /// and fails if it did not exit with zero.
+    /// </summary>
+    public class CompressorStream : Stream
+    {
+        private readonly Stream _stream;
+        private readonly Process _process;
+        private readonly Stream _stdin;
+        private readonly OutputCopy _stdout;
+        private readonly OutputCapture _stderr;
+        private bool _closed;
+
+        public CompressorStream(Stream stream, string fileName, string arguments)
+        {
+            _stream = stream;
+
+            _process = new Process();
+            _process.StartInfo.FileName = fileName;
+            _process.StartInfo.Arguments = arguments;
+            _process.StartInfo.UseShellExecute = false;
+            _process.StartInfo.CreateNoWindow = true;
+            _process.StartInfo.RedirectStandardInput = true;
+            _process.StartInfo.RedirectStandardOutput = true;
+            _process.StartInfo.RedirectStandardError = true;
+            _process.Start();
+
+            _stdin = _process.StandardInput.BaseStream;
+            _stdout = new OutputCopy(_process.StandardOutput.BaseStream, stream, Terminate);
+            _stderr = new OutputCapture(_process.StandardError.BaseStream, 65536, new UTF8Encoding(false));
+        }
+
+        public override bool CanRead { get { return false; } }
+        public override bool CanSeek { get { return false; } }
+        public override bool CanWrite { get { return !_closed; } }
+        public override long Length { get { throw new NotSupportedException(); } }
+
+        public override long Position
+        {
+            get { throw new NotSupportedException(); }
+            set { throw new NotSupportedException(); }
+        }
+
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            _stdin.Write(buffer, offset, count);
+        }
+
+        public override void Flush()
+        {
+            _stdin.Flush();
+        }
+
+        public override int Read(byte[] buffer, int offset, int count) { throw new NotSupportedException(); }
+        public override long Seek(long offset, SeekOrigin origin) { throw new NotSupportedException(); }
+        public override void SetLength(long value) { throw new NotSupportedException(); }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing && !_closed)
+            {
+                _closed = true;
+                try
+                {
+                    try
+                    {
+                        _stdin.Close();
+                    }
+                    catch (IOException) { }
+
+                    _process.WaitForExit();
+                    _stdout.Join(Timeout.Infinite);
+                    _stderr.Join(Timeout.Infinite);
+
+                    if (_stdout.Error != null)
+                    {
+                        throw new IOException("Failed to write the output of the compressor: " + _stdout.Error.Message, _stdout.Error);
+                    }
+                    if (_process.ExitCode != 0)
+                    {
+                        throw new IOException(String.Format("{0} exited with code {1}: {2}",
+                            _process.StartInfo.FileName, _process.ExitCode, _stderr.Text.Trim()));
+                    }
+                }
+                finally
+                {
+                    _process.Dispose();
+                    _stream.Dispose();
+                }
+            }
+            base.Dispose(disposing);
+        }
+
+        private void Terminate()
+        {
+            try
+            {
+                if (!_process.HasExited)
+                {
+                    _process.Kill();
+                }
+            }
+            catch (InvalidOperationException) { }
+            catch (Win32Exception) { }
+        }
+    }
+}
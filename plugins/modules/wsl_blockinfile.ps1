@@ -0,0 +1,181 @@
+#!powershell
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ..module_utils.Common
+#AnsibleRequires -PowerShell ..module_utils.WSL
+
+$spec = @{
+    options = @{
+        distribution = @{
+            type     = "str"
+            required = $true
+        }
+        path = @{
+            type     = "str"
+            required = $true
+            aliases  = @("dest", "destfile", "name")
+        }
+        block = @{
+            type     = "str"
+            default  = ""
+            aliases  = @("content")
+        }
+        marker = @{
+            type     = "str"
+            default  = "# {mark} ANSIBLE MANAGED BLOCK"
+        }
+        marker_begin = @{
+            type     = "str"
+            default  = "BEGIN"
+        }
+        marker_end = @{
+            type     = "str"
+            default  = "END"
+        }
+        state = @{
+            type     = "str"
+            choices  = @("present", "absent")
+            default  = "present"
+        }
+        insertafter = @{
+            type     = "str"
+        }
+        insertbefore = @{
+            type     = "str"
+        }
+        create = @{
+            type     = "bool"
+            default  = $false
+        }
+    }
+    mutually_exclusive = @(
+        , @("insertafter", "insertbefore")
+    )
+    supports_check_mode = $true
+}
+
+# Replaces the lines between the markers in a single pass over the file, ENVIRON values are used as is
+$blockProgram = @'
+{ lines[NR] = $0 }
+
+END {
+    marker_begin = ENVIRON["WSL_EDIT_MARKER_BEGIN"]
+    marker_end = ENVIRON["WSL_EDIT_MARKER_END"]
+
+    # The last pair of markers delimits the managed block
+    begin = 0
+    end = 0
+    for (i = 1; i <= NR; i++) {
+        if (lines[i] == marker_begin) {
+            begin = i
+        }
+        if (lines[i] == marker_end) {
+            end = i
+        }
+    }
+
+    count = 0
+    if (ENVIRON["WSL_EDIT_STATE"] == "present" && ENVIRON["WSL_EDIT_BLOCK"] != "") {
+        count = split(ENVIRON["WSL_EDIT_BLOCK"], block, "\n")
+    }
+
+    # The block is written after line number at, 0 writes it before the first line
+    if (begin && end && begin <= end) {
+        at = begin - 1
+    } else {
+        begin = 0
+        end = -1
+        at = NR
+        insert = ENVIRON["WSL_EDIT_INSERT"]
+        if (insert == "bof") {
+            at = 0
+        } else if (insert == "after" || insert == "before") {
+            hit = 0
+            for (i = 1; i <= NR; i++) {
+                if (lines[i] ~ ENVIRON["WSL_EDIT_INSERT_PATTERN"]) {
+                    hit = i
+                }
+            }
+            if (hit) {
+                at = insert == "after" ? hit : hit - 1
+            }
+        }
+    }
+
+    print (count ? "Block inserted" : "Block removed") > "/dev/stderr"
+    for (i = 0; i <= NR; i++) {
+        if (i > 0 && (i < begin || i > end)) {
+            print lines[i]
+        }
+        if (i == at && count) {
+            print marker_begin
+            for (j = 1; j <= count; j++) {
+                print block[j]
+            }
+            print marker_end
+        }
+    }
+}
+'@
+
+######################################### Main ##########################################
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$distribution_name = $module.Params.distribution
+$path = $module.Params.path
+$block = $module.Params.block
+$marker = $module.Params.marker
+$marker_begin = $module.Params.marker_begin
+$marker_end = $module.Params.marker_end
+$state = $module.Params.state
+$insertafter = $module.Params.insertafter
+$insertbefore = $module.Params.insertbefore
+$create = $module.Params.create
+$check_mode = $module.CheckMode
+
+if (-not $marker.Contains("{mark}")) {
+    $module.FailJson("marker must contain '{mark}' to tell the beginning and the end of the block apart")
+}
+
+# insertafter=EOF is the default position, BOF and EOF are keywords and not patterns
+$insert = if ($insertbefore -eq "BOF") {
+    "bof"
+} elseif ($insertbefore) {
+    "before"
+} elseif ($insertafter -and $insertafter -ne "EOF") {
+    "after"
+} else {
+    "eof"
+}
+
+try {
+    $editWSLFileContentParams = @{
+        DistributionName = $distribution_name
+        Path = $path
+        AwkProgram = $blockProgram
+        Variables = @{
+            state = $state
+            block = ($block -replace "`r`n", "`n").TrimEnd("`n")
+            marker_begin = $marker.Replace("{mark}", $marker_begin)
+            marker_end = $marker.Replace("{mark}", $marker_end)
+            insert = $insert
+            insert_pattern = if ($insertbefore) { $insertbefore } else { $insertafter }
+        }
+        Create = $create
+        WhatIf = $check_mode
+    }
+    $edit = Edit-WSLFileContent @editWSLFileContentParams
+
+    if ($edit.changed) {
+        Set-ModuleChanged -Module $module
+        $module.Result.msg = $edit.status
+        $module.Diff.prepared = $edit.diff
+    } else {
+        $module.Result.msg = ""
+    }
+
+} catch {
+    $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
+}
+
+$module.ExitJson()
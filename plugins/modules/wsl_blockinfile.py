@@ -0,0 +1,126 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+DOCUMENTATION = r'''
+---
+module: wsl_blockinfile
+short_description: Manage blocks of lines in text files in WSL distributions
+description:
+    - This module inserts, updates or removes a block of lines surrounded by marker lines in a text file in a WSL
+      distribution.
+    - The file is matched and rewritten inside the distribution with C(awk), only a unified diff of the change
+      is returned. The file content never crosses the WSL boundary.
+    - The new content is written to a temporary file next to the file and renamed over it, the owner and mode
+      of the file are kept.
+    - This is similar to the C(blockinfile) module but specifically for WSL environments.
+options:
+    distribution:
+        description:
+            - The name of the WSL distribution.
+        type: str
+        required: true
+    path:
+        description:
+            - Linux-style path of the file to modify.
+            - A symbolic link is followed and its target is modified.
+        type: str
+        required: true
+        aliases: [dest, destfile, name]
+    block:
+        description:
+            - The lines to insert between the markers.
+            - An empty block removes the markers and the lines between them, like C(state=absent).
+        type: str
+        default: ''
+        aliases: [content]
+    marker:
+        description:
+            - The marker line template, C({mark}) is replaced with C(marker_begin) or C(marker_end).
+            - The markers identify the block, use a different marker for every block in the same file.
+        type: str
+        default: '# {mark} ANSIBLE MANAGED BLOCK'
+    marker_begin:
+        description:
+            - Replaces C({mark}) in the opening marker line.
+        type: str
+        default: BEGIN
+    marker_end:
+        description:
+            - Replaces C({mark}) in the closing marker line.
+        type: str
+        default: END
+    state:
+        description:
+            - Whether the block should be there or not.
+        type: str
+        choices: [present, absent]
+        default: present
+    insertafter:
+        description:
+            - Insert a new block after the last line matching this POSIX extended regular expression.
+            - C(EOF) inserts the block at the end of the file, as does a pattern which matches no line.
+            - An existing block is updated in place.
+        type: str
+        required: false
+    insertbefore:
+        description:
+            - Insert a new block before the last line matching this POSIX extended regular expression.
+            - C(BOF) inserts the block at the beginning of the file. A pattern which matches no line inserts it at
+              the end of the file.
+            - An existing block is updated in place.
+        type: str
+        required: false
+    create:
+        description:
+            - Create the file and its parent directories if the file does not exist and a block is inserted.
+            - Without it, inserting into a missing file fails.
+        type: bool
+        default: false
+notes:
+    - This module requires PowerShell.
+    - This module requires WSL to be installed and configured.
+    - The distribution needs C(awk), C(diff), C(cmp) and C(mktemp), which are part of its base system.
+    - New files are created with the default mode of the root user, use M(vanduc2514.wsl_automation.wsl_file)
+      to set the owner and mode.
+seealso:
+    - module: ansible.builtin.blockinfile
+    - module: vanduc2514.wsl_automation.wsl_lineinfile
+    - module: vanduc2514.wsl_automation.wsl_file
+author:
+    - vanduc2514 (vanduc2514@gmail.com)
+'''
+
+EXAMPLES = r'''
+- name: Pin host names of the lab
+  vanduc2514.wsl_automation.wsl_blockinfile:
+    distribution: Ubuntu
+    path: /etc/hosts
+    marker: "# {mark} LAB HOSTS"
+    block: |
+      192.168.1.10 registry.local
+      192.168.1.11 git.local
+
+- name: Add environment to the shell of a user
+  vanduc2514.wsl_automation.wsl_blockinfile:
+    distribution: Ubuntu
+    path: /home/developer/.bashrc
+    insertbefore: BOF
+    block: |
+      export EDITOR=vim
+      export PATH="$HOME/.local/bin:$PATH"
+
+- name: Remove the lab hosts
+  vanduc2514.wsl_automation.wsl_blockinfile:
+    distribution: Ubuntu
+    path: /etc/hosts
+    marker: "# {mark} LAB HOSTS"
+    state: absent
+'''
+
+RETURN = r'''
+msg:
+    description: What was changed, empty when the file was already in the wanted state.
+    type: str
+    returned: always
+    sample: Block inserted
+'''
@@ -0,0 +1,294 @@
+#!powershell
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ..module_utils.Common
+#AnsibleRequires -PowerShell ..module_utils.WSL
+
+$spec = @{
+    options = @{
+        distribution = @{
+            type     = "str"
+            required = $true
+        }
+        cmd = @{
+            type     = "str"
+        }
+        argv = @{
+            type     = "list"
+            elements = "str"
+        }
+        user = @{
+            type     = "str"
+            default  = "root"
+        }
+        chdir = @{
+            type     = "str"
+        }
+        creates = @{
+            type     = "str"
+        }
+        removes = @{
+            type     = "str"
+        }
+        stdin = @{
+            type     = "str"
+        }
+        stdin_add_newline = @{
+            type     = "bool"
+            default  = $true
+        }
+        strip_empty_ends = @{
+            type     = "bool"
+            default  = $true
+        }
+        timeout = @{
+            type     = "int"
+            default  = 0
+        }
+        output_limit = @{
+            type     = "int"
+            default  = 0
+        }
+    }
+    mutually_exclusive = @(
+        , @("cmd", "argv")
+    )
+    required_one_of = @(
+        , @("cmd", "argv")
+    )
+    supports_check_mode = $true
+}
+
+# Printed by the guard prelude instead of running the command
+$skipMarker = "__wsl_command_skipped"
+
+
+function ConvertTo-ShellLiteral {
+    param(
+        [string]
+        $Value
+    )
+
+    return "'" + $Value.Replace("'", "'\''") + "'"
+}
+
+
+function New-CommandPrelude {
+    param(
+        [string]
+        $Chdir,
+
+        [string]
+        $Creates,
+
+        [string]
+        $Removes
+    )
+
+    # Guards are evaluated by the same shell that runs the command, so a skipped
+    # command costs a single launch of the distribution
+    $prelude = @()
+    if ($Chdir) {
+        $prelude += "cd $(ConvertTo-ShellLiteral -Value $Chdir) || exit 1"
+    }
+    if ($Creates -or $Removes) {
+        # An empty IFS keeps glob expansion of the pattern without word splitting
+        $prelude += @'
+wsl_command_exists() (
+    IFS=''
+    for path in $1; do
+        if [ -e "$path" ] || [ -L "$path" ]; then
+            return 0
+        fi
+    done
+    return 1
+)
+'@
+    }
+    if ($Creates) {
+        $prelude += "if wsl_command_exists $(ConvertTo-ShellLiteral -Value $Creates); then echo '$skipMarker creates'; exit 0; fi"
+    }
+    if ($Removes) {
+        $prelude += "if ! wsl_command_exists $(ConvertTo-ShellLiteral -Value $Removes); then echo '$skipMarker removes'; exit 0; fi"
+    }
+
+    return ($prelude -join "`n") -replace "`r`n", "`n"
+}
+
+
+function Invoke-DistributionCommand {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    param(
+        [string]
+        $DistributionName,
+
+        [string]
+        $DistributionUser,
+
+        [string]
+        $Command,
+
+        [string[]]
+        $Argv,
+
+        [string]
+        $Prelude,
+
+        [string]
+        $InputText,
+
+        [int]
+        $TimeoutSeconds,
+
+        [long]
+        $MaxOutputBytes
+    )
+
+    # With WhatIf only the guards are evaluated
+    $run = $PSCmdlet.ShouldProcess($DistributionName, "Run command as '$DistributionUser'")
+    if (-not $run -and -not $Prelude) {
+        return $null
+    }
+
+    $linuxArgv = if ($Prelude) {
+        $script = if (-not $run) {
+            "$Prelude`nexit 0"
+        } elseif ($Argv) {
+            "$Prelude`nexec `"`$@`""
+        } else {
+            "$Prelude`n$Command"
+        }
+        # The program and its arguments become the positional parameters of the prelude shell
+        @("/bin/sh", "-c", $script, "wsl_command") + @($Argv | Where-Object { $null -ne $_ })
+    } elseif ($Argv) {
+        $Argv
+    } else {
+        @("/bin/sh", "-c", $Command)
+    }
+
+    $inputWriter = $null
+    if ($run -and $InputText) {
+        $inputBytes = (New-Object -TypeName System.Text.UTF8Encoding -ArgumentList $false).GetBytes($InputText)
+        $inputWriter = { param($Stream) $Stream.Write($inputBytes, 0, $inputBytes.Length) }.GetNewClosure()
+    }
+
+    try {
+        $invokeLinuxProcessParams = @{
+            DistributionName = $DistributionName
+            DistributionUser = $DistributionUser
+            Argv = $linuxArgv
+            InputWriter = $inputWriter
+            TimeoutSeconds = $TimeoutSeconds
+            MaxOutputBytes = $MaxOutputBytes
+        }
+        return Invoke-LinuxProcess @invokeLinuxProcessParams
+    } catch {
+        throw "Failed to run command in WSL distribution '$DistributionName': $($_.Exception.Message)"
+    }
+}
+
+
+function ConvertTo-OutputLines {
+    param(
+        [string]
+        $Output
+    )
+
+    if (-not $Output) {
+        return , @()
+    }
+    return , @($Output.TrimEnd("`n") -split "`n")
+}
+
+######################################### Main ##########################################
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$distribution_name = $module.Params.distribution
+$cmd = $module.Params.cmd
+$argv = $module.Params.argv
+$user = $module.Params.user
+$chdir = $module.Params.chdir
+$creates = $module.Params.creates
+$removes = $module.Params.removes
+$stdin = $module.Params.stdin
+$stdin_add_newline = $module.Params.stdin_add_newline
+$strip_empty_ends = $module.Params.strip_empty_ends
+$timeout = $module.Params.timeout
+$output_limit = $module.Params.output_limit
+$check_mode = $module.CheckMode
+
+if ($null -ne $argv -and $argv.Count -eq 0) {
+    $module.FailJson("argv must contain at least the program to run")
+}
+
+if ($null -ne $stdin -and $stdin_add_newline) {
+    $stdin += "`n"
+}
+
+try {
+    $module.Result.cmd = if ($argv) { $argv } else { $cmd }
+
+    $invokeDistributionCommandParams = @{
+        DistributionName = $distribution_name
+        DistributionUser = $user
+        Command = $cmd
+        Argv = $argv
+        Prelude = New-CommandPrelude -Chdir $chdir -Creates $creates -Removes $removes
+        InputText = $stdin
+        TimeoutSeconds = $timeout
+        MaxOutputBytes = $output_limit
+        WhatIf = $check_mode
+    }
+    $start = Get-Date
+    $result = Invoke-DistributionCommand @invokeDistributionCommandParams
+    $end = Get-Date
+
+    $skipped = $result -and $result.ExitCode -eq 0 -and $result.Stdout.StartsWith($skipMarker)
+    if ($skipped) {
+        $module.Result.rc = 0
+        $module.Result.msg = if ($result.Stdout.StartsWith("$skipMarker creates")) {
+            "Did not run command since '$creates' exists"
+        } else {
+            "Did not run command since '$removes' does not exist"
+        }
+        $module.Result.stdout = $module.Result.msg
+        $module.ExitJson()
+    }
+
+    Set-ModuleChanged -Module $module
+
+    if ($check_mode) {
+        $module.Result.msg = "Command would have run if not in check mode"
+        $module.ExitJson()
+    }
+
+    $stdout = $result.Stdout
+    $stderr = $result.Stderr
+    if ($strip_empty_ends) {
+        $stdout = $stdout.TrimEnd("`r", "`n")
+        $stderr = $stderr.TrimEnd("`r", "`n")
+    }
+
+    $module.Result.rc = $result.ExitCode
+    $module.Result.stdout = $stdout
+    $module.Result.stderr = $stderr
+    $module.Result.stdout_lines = ConvertTo-OutputLines -Output $stdout
+    $module.Result.stderr_lines = ConvertTo-OutputLines -Output $stderr
+    $module.Result.stdout_truncated = $result.StdoutTruncated
+    $module.Result.stderr_truncated = $result.StderrTruncated
+    $module.Result.start = $start.ToString("yyyy-MM-dd HH:mm:ss.ffffff")
+    $module.Result.end = $end.ToString("yyyy-MM-dd HH:mm:ss.ffffff")
+    $module.Result.delta = ($end - $start).ToString()
+
+} catch {
+    $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
+}
+
+if ($result.TimedOut) {
+    $module.FailJson("Command did not finish within $timeout seconds")
+}
+if ($result.ExitCode -ne 0) {
+    $module.FailJson("Command exited with non-zero return code $($result.ExitCode)")
+}
+
+$module.ExitJson()
@@ -0,0 +1,194 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+DOCUMENTATION = r'''
+---
+module: wsl_command
+short_description: Execute commands in WSL distributions
+description:
+    - This module runs a command in a WSL distribution and returns its exit code and output.
+    - The command is started with C(wsl --exec), the login shell of the user does not parse it again.
+    - The C(creates) and C(removes) guards are evaluated by the same shell launch that runs the command.
+    - This is similar to the C(command) module but specifically for WSL environments.
+options:
+    distribution:
+        description:
+            - The name of the WSL distribution.
+        type: str
+        required: true
+    cmd:
+        description:
+            - The command to run, interpreted by C(/bin/sh -c).
+            - Shell features like pipes, redirections and variables are available.
+            - Mutually exclusive with C(argv).
+        type: str
+        required: false
+    argv:
+        description:
+            - The program and its arguments, executed directly without a shell.
+            - Arguments are passed as is, no quoting or escaping is needed.
+            - Mutually exclusive with C(cmd).
+        type: list
+        elements: str
+        required: false
+    user:
+        description:
+            - The user to run the command as.
+        type: str
+        default: root
+    chdir:
+        description:
+            - Change into this directory before running the command.
+            - This should be a Linux-style path.
+        type: str
+        required: false
+    creates:
+        description:
+            - A path or glob pattern. If a matching file exists, the command is not run.
+            - Relative paths are resolved against C(chdir).
+        type: str
+        required: false
+    removes:
+        description:
+            - A path or glob pattern. If no matching file exists, the command is not run.
+            - Relative paths are resolved against C(chdir).
+        type: str
+        required: false
+    stdin:
+        description:
+            - Data written to the standard input of the command.
+            - It is streamed to the command, not passed on the command line.
+        type: str
+        required: false
+    stdin_add_newline:
+        description:
+            - Whether to append a newline to C(stdin).
+        type: bool
+        default: true
+    strip_empty_ends:
+        description:
+            - Strip trailing newlines from C(stdout) and C(stderr).
+        type: bool
+        default: true
+    timeout:
+        description:
+            - Number of seconds after which the command is killed and the task fails.
+            - C(0) waits until the command exits.
+        type: int
+        default: 0
+    output_limit:
+        description:
+            - Maximum number of bytes kept from stdout and from stderr.
+            - Further output is read and discarded, C(stdout_truncated) or C(stderr_truncated) is returned as true.
+            - C(0) keeps the whole output.
+        type: int
+        default: 0
+notes:
+    - This module requires PowerShell.
+    - This module requires WSL to be installed and configured.
+    - The task fails if the command exits with a non-zero return code.
+    - In check mode the command is not run, only C(creates) and C(removes) are evaluated.
+seealso:
+    - module: ansible.builtin.command
+    - module: ansible.windows.win_command
+author:
+    - vanduc2514 (vanduc2514@gmail.com)
+'''
+
+EXAMPLES = r'''
+- name: Generate missing SSH host keys
+  vanduc2514.wsl_automation.wsl_command:
+    distribution: Ubuntu
+    argv:
+      - ssh-keygen
+      - -A
+
+- name: Build a project once
+  vanduc2514.wsl_automation.wsl_command:
+    distribution: Ubuntu
+    user: developer
+    cmd: make && make install
+    chdir: /home/developer/project
+    creates: /usr/local/bin/project
+
+- name: Load a database dump streamed through standard input
+  vanduc2514.wsl_automation.wsl_command:
+    distribution: Ubuntu
+    argv:
+      - psql
+      - --dbname=app
+    stdin: "{{ lookup('ansible.builtin.file', 'dump.sql') }}"
+
+- name: List a large directory with bounded output
+  vanduc2514.wsl_automation.wsl_command:
+    distribution: Ubuntu
+    cmd: find /usr -type f
+    timeout: 60
+    output_limit: 1048576
+  register: usr_files
+'''
+
+RETURN = r'''
+cmd:
+    description: The command that was run, a string for C(cmd) or a list for C(argv).
+    type: raw
+    returned: always
+    sample: ["ssh-keygen", "-A"]
+rc:
+    description: The exit code of the command.
+    type: int
+    returned: when the command was run or skipped by a guard
+    sample: 0
+stdout:
+    description: The standard output of the command.
+    type: str
+    returned: when the command was run or skipped by a guard
+    sample: "ssh-keygen: generating new host keys: RSA ECDSA ED25519"
+stderr:
+    description: The standard error of the command.
+    type: str
+    returned: when the command was run
+    sample: ""
+stdout_lines:
+    description: The standard output split into lines.
+    type: list
+    elements: str
+    returned: when the command was run
+    sample: ["ssh-keygen: generating new host keys: RSA ECDSA ED25519"]
+stderr_lines:
+    description: The standard error split into lines.
+    type: list
+    elements: str
+    returned: when the command was run
+    sample: []
+stdout_truncated:
+    description: Whether stdout was longer than C(output_limit).
+    type: bool
+    returned: when the command was run
+    sample: false
+stderr_truncated:
+    description: Whether stderr was longer than C(output_limit).
+    type: bool
+    returned: when the command was run
+    sample: false
+start:
+    description: The time the command was started.
+    type: str
+    returned: when the command was run
+    sample: "2024-01-01 12:00:00.000000"
+end:
+    description: The time the command finished.
+    type: str
+    returned: when the command was run
+    sample: "2024-01-01 12:00:01.000000"
+delta:
+    description: The time the command took.
+    type: str
+    returned: when the command was run
+    sample: "00:00:01.0000000"
+msg:
+    description: Why the command was not run.
+    type: str
+    returned: when skipped by a guard or in check mode
+    sample: "Did not run command since '/usr/local/bin/project' exists"
+'''
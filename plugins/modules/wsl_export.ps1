@@ -0,0 +1,364 @@
+#!powershell
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ..module_utils.Common
+#AnsibleRequires -PowerShell ..module_utils.WSL
+
+$spec = @{
+    options = @{
+        distribution = @{
+            type     = "str"
+            required = $true
+        }
+        dest = @{
+            type     = "path"
+            required = $true
+        }
+        format = @{
+            type     = "str"
+            choices  = @("tar", "vhd")
+            default  = "tar"
+        }
+        compression = @{
+            type     = "str"
+            choices  = @("auto", "zstd", "gzip", "none")
+            default  = "auto"
+        }
+        checksum_algorithm = @{
+            type     = "str"
+            choices  = @("md5", "sha1", "sha256", "sha384", "sha512")
+            default  = "sha256"
+        }
+        stop = @{
+            type     = "bool"
+            default  = $false
+        }
+        keep_count = @{
+            type     = "int"
+        }
+        keep_days = @{
+            type     = "int"
+        }
+    }
+    supports_check_mode = $true
+}
+
+$exportExtensions = @{
+    none = "tar"
+    gzip = "tar.gz"
+    zstd = "tar.zst"
+    vhd = "vhdx"
+}
+
+
+function Get-ZstdPath {
+    $zstd = Get-Command -Name zstd -CommandType Application -ErrorAction SilentlyContinue |
+        Select-Object -First 1
+    if ($zstd) {
+        return $zstd.Path
+    }
+    return $null
+}
+
+
+function New-HashAlgorithm {
+    param(
+        [string]
+        $Algorithm
+    )
+
+    switch ($Algorithm) {
+        "md5" { return [System.Security.Cryptography.MD5]::Create() }
+        "sha1" { return [System.Security.Cryptography.SHA1]::Create() }
+        "sha256" { return [System.Security.Cryptography.SHA256]::Create() }
+        "sha384" { return [System.Security.Cryptography.SHA384]::Create() }
+        "sha512" { return [System.Security.Cryptography.SHA512]::Create() }
+    }
+}
+
+
+function Suspend-WSLDistribution {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    param(
+        [string]
+        $DistributionName
+    )
+
+    if ($PSCmdlet.ShouldProcess($DistributionName, 'Stop WSL distribution for export')) {
+        try {
+            # wsl --terminate only returns once the distribution is stopped
+            Invoke-WSLCommand -Arguments @("--terminate", $DistributionName) | Out-Null
+        } catch {
+            throw "Failed to stop WSL distribution '$DistributionName': $($_.Exception.Message)"
+        }
+    }
+}
+
+
+function Resume-WSLDistribution {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    param(
+        [string]
+        $DistributionName
+    )
+
+    if ($PSCmdlet.ShouldProcess($DistributionName, 'Start WSL distribution after export')) {
+        try {
+            Create-LinuxProcess -DistributionName $DistributionName -LinuxCommand "sleep infinity" | Out-Null
+            WaitFor-WSLDistributionState -DistributionName $DistributionName
+        } catch {
+            throw "Failed to start WSL distribution '$DistributionName': $($_.Exception.Message)"
+        }
+    }
+}
+
+
+function Export-WSLDistribution {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    param(
+        [string]
+        $DistributionName,
+
+        [string]
+        $Path,
+
+        [string]
+        $Format,
+
+        [string]
+        $Compression,
+
+        [string]
+        $ZstdPath,
+
+        [string]
+        $ChecksumAlgorithm
+    )
+
+    if (-not $PSCmdlet.ShouldProcess($DistributionName, "Export WSL distribution to '$Path'")) {
+        return $null
+    }
+
+    $parentPath = Split-Path -Path $Path -Parent
+    if (-not (Test-Path -Path $parentPath)) {
+        New-Item -ItemType Directory -Path $parentPath -Force | Out-Null
+    }
+
+    # The export is written next to the destination and only renamed once complete, an
+    # interrupted export never looks like a valid backup
+    $partialPath = if ($Format -eq "vhd") {
+        [System.IO.Path]::ChangeExtension($Path, ".partial.vhdx")
+    } else {
+        "$Path.partial"
+    }
+
+    try {
+        if ($Format -eq "vhd") {
+            # wsl.exe writes the disk image itself, it cannot be streamed
+            Invoke-WSLCommand -Arguments @("--export", $DistributionName, $partialPath, "--vhd") | Out-Null
+            $checksum = (Get-FileHash -Path $partialPath -Algorithm $ChecksumAlgorithm.ToUpperInvariant()).Hash.ToLowerInvariant()
+        } else {
+            # wsl.exe writes the tar to stdout, it is compressed and hashed in the same pass
+            $file = New-Object -TypeName System.IO.FileStream -ArgumentList @(
+                $partialPath, [System.IO.FileMode]::Create, [System.IO.FileAccess]::Write, [System.IO.FileShare]::None, 1MB
+            )
+            $hashing = New-Object -TypeName ansible_collections.vanduc2514.wsl_automation.plugins.module_utils.WSLProcess.HashingStream -ArgumentList @(
+                $file, (New-HashAlgorithm -Algorithm $ChecksumAlgorithm)
+            )
+            $sink = switch ($Compression) {
+                "gzip" {
+                    New-Object -TypeName System.IO.Compression.GZipStream -ArgumentList @(
+                        $hashing, [System.IO.Compression.CompressionLevel]::Optimal
+                    )
+                }
+                "zstd" {
+                    New-Object -TypeName ansible_collections.vanduc2514.wsl_automation.plugins.module_utils.WSLProcess.CompressorStream -ArgumentList @(
+                        $hashing, $ZstdPath, "-q -c -T0"
+                    )
+                }
+                default { $hashing }
+            }
+
+            try {
+                $result = Invoke-WSLProcess -Arguments @("--export", $DistributionName, "-") -OutputSink $sink
+            }
+            finally {
+                # Flushes the compressor and closes the file
+                $sink.Dispose()
+            }
+
+            if ($result.ExitCode -ne 0) {
+                $message = if ($result.Stderr.Trim()) { $result.Stderr.Trim() } else { $result.Stdout.Trim() }
+                throw "wsl.exe exited with code $($result.ExitCode): $message"
+            }
+            $checksum = $hashing.Hash
+        }
+
+        Move-Item -LiteralPath $partialPath -Destination $Path -Force
+    } catch {
+        Remove-Item -LiteralPath $partialPath -Force -ErrorAction SilentlyContinue
+        throw "Failed to export WSL distribution '$DistributionName': $($_.Exception.Message)"
+    }
+
+    return @{
+        checksum = $checksum
+        size = (Get-Item -LiteralPath $Path).Length
+    }
+}
+
+
+function Remove-ExpiredExport {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    [OutputType([string[]])]
+    param(
+        [string]
+        $DirectoryPath,
+
+        [string]
+        $DistributionName,
+
+        [string]
+        # The export just written, always kept and counted as the newest one
+        $CurrentPath,
+
+        [AllowNull()]
+        [Nullable[int]]
+        $KeepCount,
+
+        [AllowNull()]
+        [Nullable[int]]
+        $KeepDays
+    )
+
+    if (-not (Test-Path -Path $DirectoryPath)) {
+        return , @()
+    }
+
+    $extensions = ($exportExtensions.Values | ForEach-Object { [regex]::Escape($_) }) -join '|'
+    $pattern = "^$([regex]::Escape($DistributionName))-\d{8}-\d{6}\.($extensions)$"
+
+    # The timestamp in the name sorts exports from newest to oldest
+    $exports = @(
+        Get-ChildItem -LiteralPath $DirectoryPath -File |
+            Where-Object { $_.Name -match $pattern -and $_.Name -ne (Split-Path -Path $CurrentPath -Leaf) } |
+            Sort-Object -Property Name -Descending
+    )
+
+    $expired = @()
+    if ($null -ne $KeepCount) {
+        $expired += @($exports | Select-Object -Skip ([Math]::Max(0, $KeepCount - 1)))
+    }
+    if ($null -ne $KeepDays) {
+        $cutoff = (Get-Date).AddDays(-$KeepDays)
+        $expired += @($exports | Where-Object { $_.LastWriteTime -lt $cutoff })
+    }
+
+    $removed = @($expired | ForEach-Object { $_.FullName } | Sort-Object -Unique)
+    foreach ($path in $removed) {
+        if ($PSCmdlet.ShouldProcess($path, 'Remove expired export')) {
+            try {
+                Remove-Item -LiteralPath $path -Force
+            } catch {
+                throw "Failed to remove expired export '$path': $($_.Exception.Message)"
+            }
+        }
+    }
+
+    return , $removed
+}
+
+######################################### Main ##########################################
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$distribution_name = $module.Params.distribution
+$dest = $module.Params.dest
+$format = $module.Params.format
+$compression = $module.Params.compression
+$checksum_algorithm = $module.Params.checksum_algorithm
+$stop = $module.Params.stop
+$keep_count = $module.Params.keep_count
+$keep_days = $module.Params.keep_days
+$check_mode = $module.CheckMode
+
+if ($null -ne $keep_count -and $keep_count -lt 1) {
+    $module.FailJson("keep_count must be at least 1, the new export is always kept")
+}
+if ($null -ne $keep_days -and $keep_days -lt 0) {
+    $module.FailJson("keep_days must not be negative")
+}
+
+$zstd_path = $null
+if ($format -eq "vhd") {
+    if ($compression -notin @("auto", "none")) {
+        $module.FailJson("compression '$compression' is not supported with format 'vhd'")
+    }
+    $compression = "none"
+} else {
+    $zstd_path = Get-ZstdPath
+    if ($compression -eq "auto") {
+        $compression = if ($zstd_path) { "zstd" } else { "gzip" }
+    } elseif ($compression -eq "zstd" -and -not $zstd_path) {
+        $module.FailJson("compression 'zstd' requires zstd.exe in the PATH of the Windows host")
+    }
+}
+
+$extension = if ($format -eq "vhd") { $exportExtensions.vhd } else { $exportExtensions[$compression] }
+$export_path = Join-Path -Path $dest -ChildPath "$distribution_name-$(Get-Date -Format 'yyyyMMdd-HHmmss').$extension"
+
+try {
+    $distro = Get-WSLDistribution -DistributionName $distribution_name
+    if (-not $distro) {
+        throw "WSL distribution '$distribution_name' does not exist"
+    }
+
+    $module.Result.dest = $export_path
+    $module.Result.format = $format
+    $module.Result.compression = $compression
+    $module.Result.checksum_algorithm = $checksum_algorithm
+
+    # Only a running distribution needs its state restored after the export
+    $restore_state = $stop -and $distro.state -eq 'Running'
+    $module.Result.stopped = $restore_state
+
+    if ($restore_state) {
+        Suspend-WSLDistribution -DistributionName $distribution_name -WhatIf:$check_mode
+    }
+    try {
+        $exportWSLDistributionParams = @{
+            DistributionName = $distribution_name
+            Path = $export_path
+            Format = $format
+            Compression = $compression
+            ZstdPath = $zstd_path
+            ChecksumAlgorithm = $checksum_algorithm
+            WhatIf = $check_mode
+        }
+        $export = Export-WSLDistribution @exportWSLDistributionParams
+    }
+    finally {
+        if ($restore_state) {
+            Resume-WSLDistribution -DistributionName $distribution_name -WhatIf:$check_mode
+        }
+    }
+    Set-ModuleChanged -Module $module
+
+    if ($export) {
+        $module.Result.checksum = $export.checksum
+        $module.Result.size = $export.size
+    }
+
+    $removeExpiredExportParams = @{
+        DirectoryPath = $dest
+        DistributionName = $distribution_name
+        CurrentPath = $export_path
+        KeepCount = $keep_count
+        KeepDays = $keep_days
+        WhatIf = $check_mode
+    }
+    $module.Result.removed = Remove-ExpiredExport @removeExpiredExportParams
+
+} catch {
+    $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
+}
+
+$module.ExitJson()
@@ -0,0 +1,149 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+DOCUMENTATION = r'''
+---
+module: wsl_export
+short_description: Export WSL distributions to compressed backups
+description:
+    - This module exports a WSL distribution into a new timestamped file on the Windows host.
+    - With C(format=tar), the output of C(wsl --export) is compressed and checksummed while it is streamed to the file.
+      The export is a single sequential pass and never needs the uncompressed size in free space.
+    - The export is written to a temporary file next to the destination and renamed once it is complete.
+    - Older exports of the same distribution in C(dest) can be pruned by count or age.
+options:
+    distribution:
+        description:
+            - The name of the WSL distribution to export.
+        type: str
+        required: true
+    dest:
+        description:
+            - Directory on the Windows host where the export is written. It is created if it does not exist.
+            - The file is named C(<distribution>-<yyyyMMdd-HHmmss>.<extension>).
+        type: path
+        required: true
+    format:
+        description:
+            - C(tar) exports the file system of the distribution as a tar archive.
+            - C(vhd) exports the virtual disk of a WSL 2 distribution. It is written by C(wsl.exe) directly and is not compressed.
+        type: str
+        choices: [tar, vhd]
+        default: tar
+    compression:
+        description:
+            - Compression of a C(tar) export.
+            - C(zstd) requires C(zstd.exe) in the PATH of the Windows host.
+            - C(auto) uses C(zstd) when it is available and C(gzip) otherwise.
+            - Only C(auto) and C(none) are accepted with C(format=vhd).
+        type: str
+        choices: [auto, zstd, gzip, none]
+        default: auto
+    checksum_algorithm:
+        description:
+            - Algorithm of the checksum returned for the exported file.
+        type: str
+        choices: [md5, sha1, sha256, sha384, sha512]
+        default: sha256
+    stop:
+        description:
+            - Stop a running distribution during the export for a consistent file system, and start it again afterwards.
+            - A distribution which is not running is exported as is.
+        type: bool
+        default: false
+    keep_count:
+        description:
+            - Number of exports of the distribution to keep in C(dest), including the new one.
+            - Older exports are removed.
+        type: int
+        required: false
+    keep_days:
+        description:
+            - Remove exports of the distribution in C(dest) which are older than this number of days.
+            - The new export is never removed.
+        type: int
+        required: false
+notes:
+    - This module requires PowerShell.
+    - This module requires WSL to be installed and configured.
+    - Exporting to standard output requires a WSL version which supports C(wsl --export <distribution> -).
+    - Only files named like the exports of this module are considered for pruning.
+    - In check mode nothing is exported, C(removed) lists the exports which would be removed.
+seealso:
+    - module: vanduc2514.wsl_automation.wsl_instance
+author:
+    - vanduc2514 (vanduc2514@gmail.com)
+'''
+
+EXAMPLES = r'''
+- name: Nightly backup keeping the last 7 exports
+  vanduc2514.wsl_automation.wsl_export:
+    distribution: Ubuntu
+    dest: D:\Backups\WSL
+    stop: true
+    keep_count: 7
+
+- name: Export with gzip and remove exports older than 30 days
+  vanduc2514.wsl_automation.wsl_export:
+    distribution: Debian
+    dest: D:\Backups\WSL
+    compression: gzip
+    keep_days: 30
+
+- name: Export the virtual disk
+  vanduc2514.wsl_automation.wsl_export:
+    distribution: Ubuntu
+    dest: D:\Backups\WSL
+    format: vhd
+  register: export
+
+- name: Restore the export as a new distribution
+  vanduc2514.wsl_automation.wsl_instance:
+    distribution: UbuntuRestored
+    rootfs_path: "{{ export.dest }}"
+    import_vhd: true
+'''
+
+RETURN = r'''
+dest:
+    description: Path of the exported file.
+    type: str
+    returned: always
+    sample: D:\Backups\WSL\Ubuntu-20240101-020000.tar.zst
+format:
+    description: Format of the export.
+    type: str
+    returned: always
+    sample: tar
+compression:
+    description: Compression used for the export, C(auto) is resolved to the compressor used.
+    type: str
+    returned: always
+    sample: zstd
+checksum:
+    description: Checksum of the exported file.
+    type: str
+    returned: success and not in check mode
+    sample: 3c9f1e7b0a6d4c2e8f5b1a7d9e0c3b6a2f4d8e1c7b5a9f3e6d0c2b4a8e1f7d5c
+checksum_algorithm:
+    description: Algorithm of C(checksum).
+    type: str
+    returned: always
+    sample: sha256
+size:
+    description: Size of the exported file in bytes.
+    type: int
+    returned: success and not in check mode
+    sample: 734003200
+stopped:
+    description: Whether the distribution was stopped during the export and started again afterwards.
+    type: bool
+    returned: success
+    sample: true
+removed:
+    description: Paths of the older exports which were removed.
+    type: list
+    elements: str
+    returned: success
+    sample: ["D:\\Backups\\WSL\\Ubuntu-20231225-020000.tar.zst"]
+'''
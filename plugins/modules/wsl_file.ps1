@@ -41,6 +41,14 @@ $spec = @{
             type     = "str"
             required = $false
         }
+        file_mode = @{
+            type     = "str"
+            required = $false
+        }
+        directory_mode = @{
+            type     = "str"
+            required = $false
+        }
         state = @{
             type     = "str"
             choices  = @("file", "directory", "absent")
@@ -223,10 +231,7 @@ function Set-WSLFileAttributes {
         $Group,
 
         [string]
-        $Mode,
-
-        [bool]
-        $Recursive = $false
+        $Mode
     )
 
     if ($PSCmdlet.ShouldProcess($DistributionName, "Update attributes for: $Path")) {
@@ -234,7 +239,7 @@ function Set-WSLFileAttributes {
             $changeOwnerCommandArguments = @{
                 DistributionName = $DistributionName
                 DistributionUser = 'root'
-                LinuxCommand = if ($Recursive) { "chown --recursive ${Owner}:${Group} $Path" } else { "chown ${Owner}:${Group} $Path" }
+                LinuxCommand = "chown ${Owner}:${Group} $Path"
             }
 
             Invoke-LinuxCommand @changeOwnerCommandArguments
@@ -242,7 +247,7 @@ function Set-WSLFileAttributes {
             $changeModeCommandArguments = @{
                 DistributionName = $DistributionName
                 DistributionUser = 'root'
-                LinuxCommand = if ($Recursive) { "chmod --recursive $Mode $Path" } else { "chmod $Mode $Path" }
+                LinuxCommand = "chmod $Mode $Path"
             }
 
             Invoke-LinuxCommand @changeModeCommandArguments
@@ -283,7 +288,7 @@ function New-WSLDirectory {
             Invoke-LinuxCommand @createDirectoryCommandArguments
 
             if ($Owner -or $Mode) {
-                Set-WSLFileAttributes -DistributionName $DistributionName -Owner $Owner -Mode $Mode -Path $Path -Recursive $Recursive
+                Set-WSLFileAttributes -DistributionName $DistributionName -Owner $Owner -Mode $Mode -Path $Path
             }
         } catch {
             throw "Failed to create directory '$Path' in WSL distribution '$DistributionName': $($_.Exception.Message)"
@@ -335,9 +340,14 @@ $force = $module.Params.force
 $owner = $module.Params.owner
 $group = $module.Params.group
 $mode = $module.Params.mode
+$file_mode = $module.Params.file_mode
+$directory_mode = $module.Params.directory_mode
 $state = $module.Params.state
 $check_mode = $module.CheckMode
 
+# ownership below a directory is only converged when explicitly requested
+$tree_owner_requested = $owner -or $group
+
 $owner = if ($owner) {
     $owner
 } else {
@@ -365,6 +375,10 @@ try {
         $module.FailJson("Cannot set content when state is 'directory'")
     }
 
+    if ($state -ne 'directory' -and ($file_mode -or $directory_mode)) {
+        $module.FailJson("file_mode and directory_mode can only be used when state is 'directory'")
+    }
+
     # Get current file information
     $file_info = Get-FileInfo -DistributionName $distribution_name -Path $path
     $module.Diff.before = $file_info
@@ -447,6 +461,7 @@ try {
         $file_info = Get-FileInfo -DistributionName $distribution_name -Path $path
     }
 
+    $module.Result.changed_entries = 0
     $ownerChanged = $owner -and $file_info.owner -ne $owner
     $groupChanged = $group -and $file_info.group -ne $group
     $modeChanged = $mode -and $file_info.mode -ne $mode
@@ -457,11 +472,28 @@ try {
             Owner = $owner
             Group = $group
             Mode = $mode
-            Recursive = $recursive
             WhatIf = $check_mode
         }
         Set-WSLFileAttributes @updateWSLFileAttributesParams
         Set-ModuleChanged -Module $module
+        $module.Result.changed_entries = 1
+    }
+
+    if ($state -eq 'directory' -and $recursive -and $file_info) {
+        $syncWSLTreeAttributesParams = @{
+            DistributionName = $distribution_name
+            Path = $path
+            Owner = if ($tree_owner_requested) { $owner } else { $null }
+            Group = if ($tree_owner_requested) { $group } else { $null }
+            FileMode = $file_mode
+            DirectoryMode = $directory_mode
+            WhatIf = $check_mode
+        }
+        $changed_entries = Sync-WSLTreeAttributes @syncWSLTreeAttributesParams
+        $module.Result.changed_entries += $changed_entries
+        if ($changed_entries -gt 0) {
+            Set-ModuleChanged -Module $module
+        }
     }
 
     # Update diff after
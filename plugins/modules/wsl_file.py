@@ -37,8 +37,11 @@ options:
         description:
             - Create new directories recursively.
             - Remove files and directories recursively.
+            - When state=directory, converge ownership and modes of the entries below C(path).
+              Only entries whose owner, group or mode differ are changed.
+            - Ownership below C(path) is only converged when C(owner) or C(group) is specified.
         type: bool
-        default: false
+        default: true
     force:
         description:
             - Force the operation.
@@ -62,6 +65,23 @@ options:
             - This should be a Linux-style mode (e.g., '644', '755').
         type: str
         required: false
+    file_mode:
+        description:
+            - Permission mode of the files below the directory when recursive=true.
+            - This should be an octal Linux-style mode (e.g., '644').
+            - Symbolic links are left untouched.
+            - If not specified, modes of the files below the directory are not changed.
+            - Only valid when state=directory.
+        type: str
+        required: false
+    directory_mode:
+        description:
+            - Permission mode of the directories below the directory when recursive=true.
+            - This should be an octal Linux-style mode (e.g., '755').
+            - If not specified, modes of the directories below the directory are not changed.
+            - Only valid when state=directory.
+        type: str
+        required: false
     state:
         description:
             - Whether the file or directory should exist.
@@ -74,6 +94,7 @@ options:
 notes:
     - This module requires PowerShell.
     - This module requires WSL to be installed and configured.
+    - Recursive convergence uses a single GNU C(find) pass inside the distribution.
 author:
     - Your Name (@yourgithubusername)
 '''
@@ -137,6 +158,21 @@ EXAMPLES = r'''
     group: developers
     mode: '775'
 
+- name: Converge ownership and modes of a directory tree
+  wsl_file:
+    distribution: Ubuntu
+    path: /home/user/project
+    state: directory
+    owner: user
+    mode: '755'
+    directory_mode: '755'
+    file_mode: '644'
+  register: project_dir
+
+- name: Show how many entries were changed
+  debug:
+    msg: "{{ project_dir.changed_entries }} entries changed"
+
 - name: Create file with owner but default group
   wsl_file:
     distribution: Ubuntu
@@ -152,4 +188,12 @@ path:
     type: str
     returned: always
     sample: "/home/user/test.txt"
+changed_entries:
+    description:
+        - Number of entries whose owner, group or mode was changed.
+        - Includes the entries below the directory when recursive=true and state=directory.
+        - In check mode, the number of entries that would be changed.
+    type: int
+    returned: when state is file or directory
+    sample: 12
 '''
\ No newline at end of file
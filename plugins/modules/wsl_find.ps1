@@ -0,0 +1,338 @@
+#!powershell
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ..module_utils.Common
+#AnsibleRequires -PowerShell ..module_utils.WSL
+
+$spec = @{
+    options = @{
+        distribution = @{
+            type     = "str"
+            required = $true
+        }
+        paths = @{
+            type     = "list"
+            elements = "str"
+            required = $true
+            aliases  = @("path", "name")
+        }
+        patterns = @{
+            type     = "list"
+            elements = "str"
+            default  = @("*")
+            aliases  = @("pattern")
+        }
+        excludes = @{
+            type     = "list"
+            elements = "str"
+            default  = @()
+            aliases  = @("exclude")
+        }
+        file_type = @{
+            type     = "str"
+            choices  = @("any", "file", "directory", "link")
+            default  = "file"
+        }
+        age = @{
+            type     = "str"
+        }
+        age_stamp = @{
+            type     = "str"
+            choices  = @("atime", "ctime", "mtime")
+            default  = "mtime"
+        }
+        size = @{
+            type     = "str"
+        }
+        recurse = @{
+            type     = "bool"
+            default  = $false
+        }
+        depth = @{
+            type     = "int"
+        }
+        hidden = @{
+            type     = "bool"
+            default  = $false
+        }
+        follow = @{
+            type     = "bool"
+            default  = $false
+        }
+        get_checksum = @{
+            type     = "bool"
+            default  = $false
+        }
+        checksum_algorithm = @{
+            type     = "str"
+            choices  = @("md5", "sha1", "sha224", "sha256", "sha384", "sha512")
+            default  = "sha1"
+        }
+    }
+    supports_check_mode = $true
+}
+
+
+function ConvertTo-Seconds {
+    param(
+        [string]
+        $Age
+    )
+
+    if ($Age -notmatch '^(-?\d+)([smhdw]?)$') {
+        throw "Invalid age '$Age', expected a number with an optional unit of s, m, h, d or w"
+    }
+    $units = @{ "" = 1; s = 1; m = 60; h = 3600; d = 86400; w = 604800 }
+    return [long]$Matches[1] * $units[$Matches[2]]
+}
+
+
+function ConvertTo-Bytes {
+    param(
+        [string]
+        $Size
+    )
+
+    if ($Size -notmatch '^(-?\d+)([bkmgt]?)$') {
+        throw "Invalid size '$Size', expected a number with an optional unit of b, k, m, g or t"
+    }
+    $units = @{ "" = 1; b = 1; k = 1KB; m = 1MB; g = 1GB; t = 1TB }
+    return [long]$Matches[1] * $units[$Matches[2]]
+}
+
+
+function New-FindArgv {
+    param(
+        [string[]]
+        $Paths,
+
+        [string[]]
+        $Patterns,
+
+        [string[]]
+        $Excludes,
+
+        [string]
+        $FileType,
+
+        [AllowNull()]
+        [Nullable[long]]
+        $AgeSeconds,
+
+        [string]
+        $AgeStamp,
+
+        [AllowNull()]
+        [Nullable[long]]
+        $SizeBytes,
+
+        [AllowNull()]
+        [Nullable[int]]
+        $MaxDepth,
+
+        [bool]
+        $Follow,
+
+        [string]
+        $ChecksumAlgorithm
+    )
+
+    $argv = @("find")
+    if ($Follow) {
+        $argv += "-L"
+    }
+    $argv += $Paths
+    if ($null -ne $MaxDepth) {
+        $argv += @("-maxdepth", "$MaxDepth")
+    }
+
+    $typeTests = @{ file = "f"; directory = "d"; link = "l" }
+    if ($typeTests.ContainsKey($FileType)) {
+        $argv += @("-type", $typeTests[$FileType])
+    }
+
+    if ($Patterns | Where-Object { $_ -ne "*" }) {
+        $argv += "("
+        $argv += @($Patterns | ForEach-Object { @("-name", $_, "-o") } | Select-Object -SkipLast 1)
+        $argv += ")"
+    }
+    if ($Excludes) {
+        $argv += @("!", "(")
+        $argv += @($Excludes | ForEach-Object { @("-name", $_, "-o") } | Select-Object -SkipLast 1)
+        $argv += ")"
+    }
+
+    if ($null -ne $AgeSeconds) {
+        # A positive age selects entries older than the age, a negative one younger entries
+        $cutoff = [DateTimeOffset]::UtcNow.ToUnixTimeSeconds() - [Math]::Abs($AgeSeconds)
+        $stamp = $AgeStamp.Substring(0, 1)
+        if ($AgeSeconds -ge 0) {
+            $argv += @("!", "-newer${stamp}t", "@$cutoff")
+        } else {
+            $argv += @("-newer${stamp}t", "@$cutoff")
+        }
+    }
+
+    # A size of 0 selects every file, find rejects the +-1c it would become
+    if ($null -ne $SizeBytes -and $SizeBytes -ne 0) {
+        # Like ansible.builtin.find, the size only filters files and is inclusive
+        $sizeTest = if ($SizeBytes -gt 0) { "+$($SizeBytes - 1)c" } else { "-$([Math]::Abs($SizeBytes) + 1)c" }
+        $argv += @("(", "!", "-type", "f", "-o", "-size", $sizeTest, ")")
+    }
+
+    # The search path itself is part of the output, its depth tells whether it was named explicitly
+    $argv += @("-printf", "%d\t%y\t%s\t%T@\t%u\t%g\t%m\t%l\t%p\n")
+    if ($ChecksumAlgorithm) {
+        $argv += @("(", "-type", "f", "-exec", "${ChecksumAlgorithm}sum", "{}", "+", "-o", "-true", ")")
+    }
+
+    return , $argv
+}
+
+
+function Find-WSLFile {
+    param(
+        [Ansible.Basic.AnsibleModule]
+        $Module,
+
+        [string]
+        $DistributionName,
+
+        [string[]]
+        $Argv,
+
+        [bool]
+        $Hidden
+    )
+
+    try {
+        $result = Invoke-LinuxProcess -DistributionName $DistributionName -Argv $Argv
+    } catch {
+        throw "Failed to find files in WSL distribution '$DistributionName': $($_.Exception.Message)"
+    }
+
+    # find exits with 1 when some paths could not be read, the others are still listed
+    if ($result.ExitCode -notin @(0, 1)) {
+        $message = if ($result.Stderr.Trim()) { $result.Stderr.Trim() } else { $result.Stdout.Trim() }
+        throw "Failed to find files in WSL distribution '$DistributionName': find exited with code $($result.ExitCode): $message"
+    }
+
+    $skippedPaths = @{}
+    foreach ($line in $result.Stderr -split "`n") {
+        if ($line -match "^find: '(.+)': (.+)$") {
+            $skippedPaths[$Matches[1]] = $Matches[2]
+        } elseif ($line.Trim()) {
+            $Module.Warn($line.Trim())
+        }
+    }
+
+    $types = @{ f = "file"; d = "directory"; l = "link" }
+    $files = [System.Collections.Generic.List[Object]]@()
+    # Linux paths are case sensitive, PowerShell hashtables are not
+    $checksums = New-Object -TypeName 'System.Collections.Generic.Dictionary[string,string]' -ArgumentList @(
+        [System.StringComparer]::Ordinal
+    )
+    foreach ($line in $result.Stdout -split "`n") {
+        if ($line -match '^([0-9a-f]{32,128})  (.+)$') {
+            $checksums[$Matches[2]] = $Matches[1]
+            continue
+        }
+
+        $fields = $line -split "`t", 9
+        if ($fields.Count -ne 9) {
+            continue
+        }
+
+        $depth = [int]$fields[0]
+        $type = if ($types.ContainsKey($fields[1])) { $types[$fields[1]] } else { "other" }
+        $path = $fields[8]
+
+        # Directories named in paths are searched, not returned
+        if ($depth -eq 0 -and $type -eq "directory") {
+            continue
+        }
+        if (-not $Hidden -and $depth -gt 0 -and ($path -split '/')[-1].StartsWith('.')) {
+            continue
+        }
+
+        $entry = @{
+            path = $path
+            type = $type
+            size = [long]$fields[2]
+            mtime = [double]::Parse($fields[3], [System.Globalization.CultureInfo]::InvariantCulture)
+            owner = $fields[4]
+            group = $fields[5]
+            mode = $fields[6]
+        }
+        if ($type -eq "link") {
+            $entry.link_target = $fields[7]
+        }
+        $files.Add($entry)
+    }
+
+    if ($checksums.Count -gt 0) {
+        foreach ($entry in $files) {
+            if ($checksums.ContainsKey($entry.path)) {
+                $entry.checksum = $checksums[$entry.path]
+            }
+        }
+    }
+
+    return @{
+        files = $files
+        skipped_paths = $skippedPaths
+    }
+}
+
+######################################### Main ##########################################
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$distribution_name = $module.Params.distribution
+$paths = $module.Params.paths
+$patterns = $module.Params.patterns
+$excludes = $module.Params.excludes
+$file_type = $module.Params.file_type
+$age = $module.Params.age
+$age_stamp = $module.Params.age_stamp
+$size = $module.Params.size
+$recurse = $module.Params.recurse
+$depth = $module.Params.depth
+$hidden = $module.Params.hidden
+$follow = $module.Params.follow
+$get_checksum = $module.Params.get_checksum
+$checksum_algorithm = $module.Params.checksum_algorithm
+
+$max_depth = if (-not $recurse) {
+    1
+} elseif ($null -ne $depth) {
+    $depth
+} else {
+    $null
+}
+
+try {
+    $newFindArgvParams = @{
+        Paths = $paths
+        Patterns = $patterns
+        Excludes = $excludes
+        FileType = $file_type
+        AgeSeconds = if ($age) { ConvertTo-Seconds -Age $age } else { $null }
+        AgeStamp = $age_stamp
+        SizeBytes = if ($size) { ConvertTo-Bytes -Size $size } else { $null }
+        MaxDepth = $max_depth
+        Follow = $follow
+        ChecksumAlgorithm = if ($get_checksum) { $checksum_algorithm } else { $null }
+    }
+    $argv = New-FindArgv @newFindArgvParams
+
+    $found = Find-WSLFile -Module $module -DistributionName $distribution_name -Argv $argv -Hidden $hidden
+
+    $module.Result.files = $found.files
+    $module.Result.matched = $found.files.Count
+    $module.Result.skipped_paths = $found.skipped_paths
+
+} catch {
+    $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
+}
+
+$module.ExitJson()
@@ -0,0 +1,202 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+DOCUMENTATION = r'''
+---
+module: wsl_find
+short_description: Find files in WSL distributions
+description:
+    - This module returns the files in a WSL distribution which match a set of filters, along with their attributes.
+    - All paths, filters and checksums are handled by a single C(find) process in the distribution.
+    - Paths which are files are returned themselves when they match the filters, directories are searched.
+      This answers which of several files exist in one call.
+    - This is similar to the C(find) module but specifically for WSL environments.
+options:
+    distribution:
+        description:
+            - The name of the WSL distribution.
+        type: str
+        required: true
+    paths:
+        description:
+            - Linux-style paths of the files to return or the directories to search.
+            - Paths which do not exist are listed in C(skipped_paths).
+        type: list
+        elements: str
+        required: true
+        aliases: [path, name]
+    patterns:
+        description:
+            - Shell glob patterns matched against the base name of the files.
+            - A file matching any of the patterns is returned.
+        type: list
+        elements: str
+        default: ['*']
+        aliases: [pattern]
+    excludes:
+        description:
+            - Shell glob patterns of base names which are not returned.
+        type: list
+        elements: str
+        default: []
+        aliases: [exclude]
+    file_type:
+        description:
+            - Type of the files to return.
+        type: str
+        choices: [any, file, directory, link]
+        default: file
+    age:
+        description:
+            - Select files whose age is equal to or greater than the specified time.
+            - Use a negative age to find files equal to or less than the specified time.
+            - The age is a number of seconds, or a number followed by C(s), C(m), C(h), C(d) or C(w).
+        type: str
+        required: false
+    age_stamp:
+        description:
+            - The time stamp of the files C(age) is compared against.
+        type: str
+        choices: [atime, ctime, mtime]
+        default: mtime
+    size:
+        description:
+            - Select files whose size is equal to or greater than the specified size.
+            - Use a negative size to find files equal to or less than the specified size.
+            - The size is a number of bytes, or a number followed by C(b), C(k), C(m), C(g) or C(t).
+            - Only regular files are filtered by size.
+        type: str
+        required: false
+    recurse:
+        description:
+            - Search the directories in C(paths) recursively.
+        type: bool
+        default: false
+    depth:
+        description:
+            - Maximum depth of the recursive search, C(1) only searches the directories in C(paths).
+            - Only used with C(recurse=true).
+        type: int
+        required: false
+    hidden:
+        description:
+            - Return files whose name starts with a dot.
+            - Hidden files named in C(paths) are always returned.
+        type: bool
+        default: false
+    follow:
+        description:
+            - Follow symbolic links, the attributes of their targets are returned.
+        type: bool
+        default: false
+    get_checksum:
+        description:
+            - Return the checksum of regular files.
+        type: bool
+        default: false
+    checksum_algorithm:
+        description:
+            - Algorithm of the checksum, computed with the C(<algorithm>sum) tool of the distribution.
+        type: str
+        choices: [md5, sha1, sha224, sha256, sha384, sha512]
+        default: sha1
+notes:
+    - This module requires PowerShell.
+    - This module requires WSL to be installed and configured.
+    - This module never changes the distribution and supports check mode.
+seealso:
+    - module: ansible.builtin.find
+    - module: vanduc2514.wsl_automation.wsl_exists
+author:
+    - vanduc2514 (vanduc2514@gmail.com)
+'''
+
+EXAMPLES = r'''
+- name: Check which host keys exist
+  vanduc2514.wsl_automation.wsl_find:
+    distribution: Ubuntu
+    paths:
+      - /etc/ssh/ssh_host_rsa_key
+      - /etc/ssh/ssh_host_ecdsa_key
+      - /etc/ssh/ssh_host_ed25519_key
+  register: host_keys
+
+- name: Find logs larger than 10 MB not modified for a week
+  vanduc2514.wsl_automation.wsl_find:
+    distribution: Ubuntu
+    paths: /var/log
+    patterns: "*.log"
+    size: 10m
+    age: 1w
+    recurse: true
+
+- name: Checksum the configuration files of a project
+  vanduc2514.wsl_automation.wsl_find:
+    distribution: Ubuntu
+    paths: /home/developer/project
+    patterns:
+      - "*.yml"
+      - "*.json"
+    excludes: "*.lock.json"
+    recurse: true
+    depth: 2
+    get_checksum: true
+    checksum_algorithm: sha256
+'''
+
+RETURN = r'''
+files:
+    description: The files which matched, in the order C(find) listed them.
+    type: list
+    elements: dict
+    returned: success
+    contains:
+        path:
+            description: Path of the file.
+            type: str
+            sample: /etc/ssh/ssh_host_rsa_key
+        type:
+            description: Type of the file, one of C(file), C(directory), C(link) or C(other).
+            type: str
+            sample: file
+        size:
+            description: Size of the file in bytes.
+            type: int
+            sample: 2602
+        mtime:
+            description: Modification time of the file in seconds since the epoch.
+            type: float
+            sample: 1704067200.123456
+        owner:
+            description: Name of the owner of the file.
+            type: str
+            sample: root
+        group:
+            description: Name of the group of the file.
+            type: str
+            sample: root
+        mode:
+            description: Permission bits of the file in octal.
+            type: str
+            sample: "600"
+        link_target:
+            description: Target of the symbolic link.
+            type: str
+            returned: when I(type=link)
+            sample: /usr/share/zoneinfo/Etc/UTC
+        checksum:
+            description: Checksum of the file.
+            type: str
+            returned: when I(get_checksum=true) and I(type=file)
+            sample: 2aae6c35c94fcfb415dbe95f408b9ce91ee846ed
+matched:
+    description: Number of files which matched.
+    type: int
+    returned: success
+    sample: 3
+skipped_paths:
+    description: Paths which could not be read, mapped to the reason.
+    type: dict
+    returned: success
+    sample: {"/etc/ssh/ssh_host_ecdsa_key": "No such file or directory"}
+'''
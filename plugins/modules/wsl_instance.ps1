@@ -46,7 +46,7 @@ $spec = @{
         }
         state = @{
             type     = "str"
-            choices  = @("run", "stop", "absent")
+            choices  = @("run", "stop", "restart", "absent")
             default  = "stop"
         }
     }
@@ -54,59 +54,6 @@ $spec = @{
 }
 
 
-function Get-WSLDistribution {
-    param(
-        [string]
-        $DistributionName
-    )
-
-    # Get all available distributions
-    $distributions = List-WSLDistribution
-
-    if (-not $distributions) {
-        return $null
-    }
-
-    foreach ($distro in $distributions) {
-        # If the distro found in distributions
-        if ($distro.name -eq $DistributionName) {
-            return $distro
-        }
-    }
-
-    return $null
-}
-
-
-function List-WSLDistribution {
-    $wslDistros = Invoke-WSLCommand -Arguments @("--list", "--verbose")
-
-    # Split the output into lines and remove empty lines
-    # Skip the header line and process the remaining lines
-    $lines = $wslDistros -split "\n" | Where-Object { $_ -ne '' } | Select-Object -Skip 1
-
-    # Create an array to store the distribution objects
-    $distributions = @()
-
-    foreach ($line in $lines) {
-        # Split on multiple spaces and remove empty elements and asterisk
-        $parts = $line -split '\s+' | Where-Object { $_ -ne '' -and $_ -ne '*' }
-
-        if ($parts -and $parts.Count -gt 0) {
-            $distro = [PSCustomObject]@{
-                name    = $parts[0]
-                state   = $parts[1]
-                arch_version = $parts[2]
-            }
-        }
-
-        $distributions += $distro
-    }
-
-    return $distributions
-}
-
-
 function Get-WSLOnlineDistribution {
     $wslDistros = Invoke-WSLCommand -Arguments @("--list", "--online")
 
@@ -371,29 +318,25 @@ function Stop-WSLDistribution {
 }
 
 
-function WaitFor-WSLDistributionState {
+function Restart-WSLDistribution {
+    [CmdletBinding(SupportsShouldProcess = $true)]
     param(
         [string]
-        $DistributionName,
-
-        [int]
-        # Default to 5 minutes (300 seconds)
-        $TimeoutSeconds = 300,
-
-        [string]
-        $State = 'Running'
+        $DistributionName
     )
 
-    $startTime = Get-Date
-    $timeout = New-TimeSpan -Seconds $TimeoutSeconds
+    if ($PSCmdlet.ShouldProcess($DistributionName, 'Restart WSL distribution')) {
+        try {
+            # wsl --terminate only returns once the distribution is stopped, there is no need
+            # to poll for the stopped state before starting it again
+            $wslArguments = @("--terminate", $DistributionName)
+            Invoke-WSLCommand -Arguments $wslArguments | Out-Null
 
-    do {
-        Start-Sleep -Seconds 2
-        $distro = Get-WSLDistribution -DistributionName $DistributionName
-        if ((Get-Date) - $startTime -gt $timeout) {
-            throw "Timeout waiting for WSL distribution '$DistributionName' to have state '$State'."
+            Start-WSLDistribution -DistributionName $DistributionName
+        } catch {
+            throw "Failed to restart WSL distribution '$DistributionName': $($_.Exception.Message)"
         }
-    } while ($distro.state -ne $State)
+    }
 }
 
 
@@ -514,6 +457,11 @@ try {
         Set-ModuleChanged -Module $module
     }
 
+    if ($state -eq 'restart') {
+        Restart-WSLDistribution -DistributionName $distribution -WhatIf:$check_mode
+        Set-ModuleChanged -Module $module
+    }
+
     if ($module.Result.changed) {
         $module.Diff.after = Get-WSLDistribution -DistributionName $distribution
     }
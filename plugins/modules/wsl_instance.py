@@ -79,9 +79,11 @@ options:
       - Desired state of the WSL distribution.
       - C(run) ensures the distribution is running in background.
       - C(stop) ensures the distribution is stopped.
+      - C(restart) terminates the distribution and runs it again, it always reports a change.
+        A stopped distribution is only started.
       - C(absent) ensures the distribution is removed.
     type: str
-    choices: [run, stop, absent]
+    choices: [run, stop, restart, absent]
     default: stop
 notes:
   - This module requires Windows 10 version 1903 or higher, or Windows 11.
@@ -138,6 +140,11 @@ EXAMPLES = r'''
     distribution: Ubuntu
     state: stop
 
+- name: Restart a WSL distribution to apply wsl.conf changes
+  ansible.windows.wsl_instance:
+    distribution: Ubuntu
+    state: restart
+
 - name: Remove a WSL distribution
   ansible.windows.wsl_instance:
     distribution: Ubuntu
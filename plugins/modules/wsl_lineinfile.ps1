@@ -0,0 +1,206 @@
+#!powershell
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ..module_utils.Common
+#AnsibleRequires -PowerShell ..module_utils.WSL
+
+$spec = @{
+    options = @{
+        distribution = @{
+            type     = "str"
+            required = $true
+        }
+        path = @{
+            type     = "str"
+            required = $true
+            aliases  = @("dest", "destfile", "name")
+        }
+        line = @{
+            type     = "str"
+            aliases  = @("value")
+        }
+        regexp = @{
+            type     = "str"
+            aliases  = @("regex")
+        }
+        search_string = @{
+            type     = "str"
+        }
+        state = @{
+            type     = "str"
+            choices  = @("present", "absent")
+            default  = "present"
+        }
+        insertafter = @{
+            type     = "str"
+        }
+        insertbefore = @{
+            type     = "str"
+        }
+        firstmatch = @{
+            type     = "bool"
+            default  = $false
+        }
+        create = @{
+            type     = "bool"
+            default  = $false
+        }
+    }
+    mutually_exclusive = @(
+        @("insertafter", "insertbefore"),
+        @("regexp", "search_string")
+    )
+    required_if = @(
+        , @("state", "present", @("line"))
+    )
+    required_one_of = @(
+        , @("line", "regexp", "search_string")
+    )
+    supports_check_mode = $true
+}
+
+# Replaces or inserts the line in a single pass over the file, ENVIRON values are used as is
+$lineProgram = @'
+function matches(s) {
+    if (ENVIRON["WSL_EDIT_MATCH"] == "regexp") {
+        return s ~ ENVIRON["WSL_EDIT_PATTERN"]
+    }
+    if (ENVIRON["WSL_EDIT_MATCH"] == "search_string") {
+        return index(s, ENVIRON["WSL_EDIT_PATTERN"]) > 0
+    }
+    return s == ENVIRON["WSL_EDIT_LINE"]
+}
+
+{ lines[NR] = $0 }
+
+END {
+    line = ENVIRON["WSL_EDIT_LINE"]
+    firstmatch = ENVIRON["WSL_EDIT_FIRSTMATCH"] == "1"
+
+    if (ENVIRON["WSL_EDIT_STATE"] == "absent") {
+        removed = 0
+        for (i = 1; i <= NR; i++) {
+            if (matches(lines[i])) {
+                removed++
+            } else {
+                print lines[i]
+            }
+        }
+        print removed " line(s) removed" > "/dev/stderr"
+        exit
+    }
+
+    # The last matching line is replaced, or the first one with firstmatch
+    found = 0
+    exists = 0
+    for (i = 1; i <= NR; i++) {
+        if (ENVIRON["WSL_EDIT_MATCH"] != "line" && matches(lines[i]) && !(found && firstmatch)) {
+            found = i
+        }
+        if (lines[i] == line) {
+            exists = 1
+        }
+    }
+
+    # The line is inserted after line number at, 0 inserts it before the first line
+    at = -1
+    if (found) {
+        lines[found] = line
+        print "line replaced" > "/dev/stderr"
+    } else if (!exists) {
+        at = NR
+        insert = ENVIRON["WSL_EDIT_INSERT"]
+        if (insert == "bof") {
+            at = 0
+        } else if (insert == "after" || insert == "before") {
+            hit = 0
+            for (i = 1; i <= NR; i++) {
+                if (lines[i] ~ ENVIRON["WSL_EDIT_INSERT_PATTERN"] && !(hit && firstmatch)) {
+                    hit = i
+                }
+            }
+            if (hit) {
+                at = insert == "after" ? hit : hit - 1
+            }
+        }
+        print "line added" > "/dev/stderr"
+    }
+
+    if (at == 0) {
+        print line
+    }
+    for (i = 1; i <= NR; i++) {
+        print lines[i]
+        if (i == at) {
+            print line
+        }
+    }
+}
+'@
+
+######################################### Main ##########################################
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$distribution_name = $module.Params.distribution
+$path = $module.Params.path
+$line = $module.Params.line
+$regexp = $module.Params.regexp
+$search_string = $module.Params.search_string
+$state = $module.Params.state
+$insertafter = $module.Params.insertafter
+$insertbefore = $module.Params.insertbefore
+$firstmatch = $module.Params.firstmatch
+$create = $module.Params.create
+$check_mode = $module.CheckMode
+
+$match = if ($null -ne $regexp) {
+    "regexp"
+} elseif ($null -ne $search_string) {
+    "search_string"
+} else {
+    "line"
+}
+
+# insertafter=EOF is the default position, BOF and EOF are keywords and not patterns
+$insert = if ($insertbefore -eq "BOF") {
+    "bof"
+} elseif ($insertbefore) {
+    "before"
+} elseif ($insertafter -and $insertafter -ne "EOF") {
+    "after"
+} else {
+    "eof"
+}
+
+try {
+    $editWSLFileContentParams = @{
+        DistributionName = $distribution_name
+        Path = $path
+        AwkProgram = $lineProgram
+        Variables = @{
+            state = $state
+            line = $line
+            match = $match
+            pattern = if ($match -eq "regexp") { $regexp } else { $search_string }
+            insert = $insert
+            insert_pattern = if ($insertbefore) { $insertbefore } else { $insertafter }
+            firstmatch = [int]$firstmatch
+        }
+        Create = $create
+        WhatIf = $check_mode
+    }
+    $edit = Edit-WSLFileContent @editWSLFileContentParams
+
+    if ($edit.changed) {
+        Set-ModuleChanged -Module $module
+        $module.Result.msg = $edit.status
+        $module.Diff.prepared = $edit.diff
+    } else {
+        $module.Result.msg = ""
+    }
+
+} catch {
+    $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
+}
+
+$module.ExitJson()
@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+DOCUMENTATION = r'''
+---
+module: wsl_lineinfile
+short_description: Manage lines in text files in WSL distributions
+description:
+    - This module ensures a particular line is in a text file in a WSL distribution, or replaces an existing line
+      using a regular expression.
+    - The file is matched and rewritten inside the distribution with C(awk), only a unified diff of the change
+      is returned. The file content never crosses the WSL boundary.
+    - The new content is written to a temporary file next to the file and renamed over it, the owner and mode
+      of the file are kept.
+    - This is similar to the C(lineinfile) module but specifically for WSL environments.
+options:
+    distribution:
+        description:
+            - The name of the WSL distribution.
+        type: str
+        required: true
+    path:
+        description:
+            - Linux-style path of the file to modify.
+            - A symbolic link is followed and its target is modified.
+        type: str
+        required: true
+        aliases: [dest, destfile, name]
+    line:
+        description:
+            - The line to insert or replace into the file.
+            - Required for C(state=present).
+            - With C(state=absent) and no C(regexp) or C(search_string), lines equal to C(line) are removed.
+        type: str
+        required: false
+        aliases: [value]
+    regexp:
+        description:
+            - POSIX extended regular expression matched against every line of the file.
+            - With C(state=present), the last matching line is replaced by C(line). If no line matches, C(line) is
+              inserted unless it is already in the file.
+            - With C(state=absent), all matching lines are removed.
+            - Back references are not supported.
+            - Only POSIX ERE is portable across distributions, the C(awk) of some of them does not understand
+              extensions such as C(\s) or C(\d), use C([[:space:]]) or C([0-9]) instead.
+        type: str
+        required: false
+        aliases: [regex]
+    search_string:
+        description:
+            - A literal string searched in every line of the file, used like C(regexp).
+        type: str
+        required: false
+    state:
+        description:
+            - Whether the line should be there or not.
+        type: str
+        choices: [present, absent]
+        default: present
+    insertafter:
+        description:
+            - Insert C(line) after the last line matching this POSIX extended regular expression,
+              only POSIX ERE is portable across distributions.
+            - C(EOF) inserts the line at the end of the file, as does a pattern which matches no line.
+        type: str
+        required: false
+    insertbefore:
+        description:
+            - Insert C(line) before the last line matching this POSIX extended regular expression,
+              only POSIX ERE is portable across distributions.
+            - C(BOF) inserts the line at the beginning of the file. A pattern which matches no line inserts it at
+              the end of the file.
+        type: str
+        required: false
+    firstmatch:
+        description:
+            - Use the first line matching C(regexp), C(search_string), C(insertafter) or C(insertbefore) instead of
+              the last one.
+        type: bool
+        default: false
+    create:
+        description:
+            - Create the file and its parent directories if the file does not exist and a line is inserted.
+            - Without it, inserting into a missing file fails.
+        type: bool
+        default: false
+notes:
+    - This module requires PowerShell.
+    - This module requires WSL to be installed and configured.
+    - The distribution needs C(awk), C(diff), C(cmp) and C(mktemp), which are part of its base system.
+    - New files are created with the default mode of the root user, use M(vanduc2514.wsl_automation.wsl_file)
+      to set the owner and mode.
+seealso:
+    - module: ansible.builtin.lineinfile
+    - module: vanduc2514.wsl_automation.wsl_blockinfile
+    - module: vanduc2514.wsl_automation.wsl_file
+author:
+    - vanduc2514 (vanduc2514@gmail.com)
+'''
+
+EXAMPLES = r'''
+- name: Resolve a host name locally
+  vanduc2514.wsl_automation.wsl_lineinfile:
+    distribution: Ubuntu
+    path: /etc/hosts
+    regexp: '[[:space:]]registry\.local$'
+    line: 192.168.1.10 registry.local
+
+- name: Disable password authentication
+  vanduc2514.wsl_automation.wsl_lineinfile:
+    distribution: Ubuntu
+    path: /etc/ssh/sshd_config
+    regexp: '^#?PasswordAuthentication '
+    line: PasswordAuthentication no
+    insertafter: '^#?PubkeyAuthentication '
+
+- name: Allow passwordless sudo for a user
+  vanduc2514.wsl_automation.wsl_lineinfile:
+    distribution: Ubuntu
+    path: /etc/sudoers.d/developer
+    line: developer ALL=(ALL) NOPASSWD:ALL
+    create: true
+
+- name: Remove an alias
+  vanduc2514.wsl_automation.wsl_lineinfile:
+    distribution: Ubuntu
+    path: /home/developer/.bashrc
+    search_string: alias ll=
+    state: absent
+'''
+
+RETURN = r'''
+msg:
+    description: What was changed, empty when the file was already in the wanted state.
+    type: str
+    returned: always
+    sample: line replaced
+'''
@@ -25,6 +25,10 @@ $spec = @{
             type     = "bool"
             default  = $false
         }
+        lock_timeout = @{
+            type     = "int"
+            default  = 300
+        }
         state = @{
             type     = "str"
             choices  = @("present", "absent")
@@ -137,6 +141,121 @@ function Get-PackageInfo {
 }
 
 
+function Invoke-PackageTransaction {
+    param(
+        [string]
+        $DistributionName,
+
+        [string]
+        $PackageManager,
+
+        [string]
+        $Command,
+
+        [int]
+        $LockTimeout
+    )
+
+    # fcntl/flock lock files are checked through /proc/locks, *.pid files through
+    # the process they name and *.lck files by their existence
+    $lockFiles = switch ($PackageManager) {
+        "apt" { "/var/lib/dpkg/lock-frontend /var/lib/dpkg/lock /var/lib/apt/lists/lock /var/cache/apt/archives/lock" }
+        "dnf" { "/var/lib/rpm/.rpm.lock /var/cache/dnf/rpmdb_lock.pid /var/cache/dnf/metadata_lock.pid /var/cache/dnf/download_lock.pid" }
+        "yum" { "/var/lib/rpm/.rpm.lock /var/run/yum.pid" }
+        "zypper" { "/var/lib/rpm/.rpm.lock /var/run/zypp.pid" }
+        "pacman" { "/var/lib/pacman/db.lck" }
+        "apk" { "/lib/apk/db/lock" }
+        default { throw "Unsupported package manager: $PackageManager" }
+    }
+
+    $lockErrorPattern = 'could not get lock|unable to (acquire|lock|obtain)|another app is currently holding|system management is locked|database is locked'
+
+    # The lock is waited for in the same launch as the transaction, the script is
+    # sent through stdin so the command does not need any quoting
+    $transactionScript = @'
+locks='__LOCKS__'
+timeout=__TIMEOUT__
+waited=0
+
+lock_held() {
+    for lock in $locks; do
+        [ -e "$lock" ] || continue
+        case "$lock" in
+            *.pid)
+                pid=$(cat "$lock" 2>/dev/null)
+                [ -n "$pid" ] && kill -0 "$pid" 2>/dev/null && return 0
+                ;;
+            *.lck)
+                return 0
+                ;;
+            *)
+                inode=$(stat -c %i "$lock" 2>/dev/null) && grep -q ":$inode " /proc/locks 2>/dev/null && return 0
+                ;;
+        esac
+    done
+    return 1
+}
+
+while :; do
+    while lock_held; do
+        if [ "$waited" -ge "$timeout" ]; then
+            echo "__wsl_package_status 1 $waited timeout"
+            exit 0
+        fi
+        sleep 1
+        waited=$((waited + 1))
+    done
+
+    output=$( { __COMMAND__ ; } </dev/null 2>&1 )
+    rc=$?
+
+    # Another process took the lock between the check and the transaction
+    if [ "$rc" -ne 0 ] && [ "$waited" -lt "$timeout" ] && printf '%s' "$output" | grep -qiE '__PATTERN__'; then
+        sleep 1
+        waited=$((waited + 1))
+        continue
+    fi
+    break
+done
+
+printf '%s\n' "$output"
+echo "__wsl_package_status $rc $waited done"
+'@
+    $transactionScript = $transactionScript.Replace('__LOCKS__', $lockFiles)
+    $transactionScript = $transactionScript.Replace('__TIMEOUT__', "$LockTimeout")
+    $transactionScript = $transactionScript.Replace('__PATTERN__', $lockErrorPattern)
+    $transactionScript = $transactionScript.Replace('__COMMAND__', $Command) -replace "`r`n", "`n"
+    $scriptBytes = (New-Object -TypeName System.Text.UTF8Encoding -ArgumentList $false).GetBytes($transactionScript)
+
+    $linuxCommandParams = @{
+        DistributionName = $DistributionName
+        DistributionUser = 'root'
+        LinuxCommand     = "/bin/sh -s"
+        InputWriter      = { param($Stream) $Stream.Write($scriptBytes, 0, $scriptBytes.Length) }.GetNewClosure()
+    }
+    $lines = @((Invoke-LinuxCommandWithInput @linuxCommandParams).TrimEnd() -split "`n")
+
+    $status = $lines[-1] -split ' '
+    if ($status[0] -ne '__wsl_package_status') {
+        throw "Unexpected output from package transaction: $($lines -join "`n")"
+    }
+    $output = ($lines | Select-Object -First ($lines.Count - 1)) -join "`n"
+    $lockWait = [int]$status[2]
+
+    if ($status[3] -eq 'timeout') {
+        throw "Timed out after $lockWait seconds waiting for the $PackageManager lock to be released"
+    }
+    if ([int]$status[1] -ne 0) {
+        throw "Command exited with code $($status[1]): $output"
+    }
+
+    return @{
+        output = $output
+        lock_wait = $lockWait
+    }
+}
+
+
 function Update-PackageCache {
     [CmdletBinding(SupportsShouldProcess = $true)]
     param(
@@ -144,7 +263,10 @@ function Update-PackageCache {
         $DistributionName,
 
         [string]
-        $PackageManager
+        $PackageManager,
+
+        [int]
+        $LockTimeout
     )
 
     if ($PSCmdlet.ShouldProcess($DistributionName, 'Update package cache')) {
@@ -155,21 +277,22 @@ function Update-PackageCache {
                     "DEBCONF_NONINTERACTIVE_SEEN=true " + `
                     "apt-get update"
                 }
-                "dnf" { "LC_ALL=C.UTF-8 dnf makecache -y -q &> /dev/null" }
-                "yum" { "LC_ALL=C.UTF-8 yum makecache -y -q &> /dev/null" }
+                "dnf" { "LC_ALL=C.UTF-8 dnf makecache -y -q" }
+                "yum" { "LC_ALL=C.UTF-8 yum makecache -y -q" }
                 "zypper" { "LC_ALL=C.UTF-8 zypper refresh" }
                 "pacman" { "pacman -Sy" }
                 "apk" { "apk update" }
                 default { throw "Unsupported package manager: $PackageManager" }
             }
 
-            $updateCacheCommandArguments = @{
+            $updateCacheTransactionArguments = @{
                 DistributionName = $DistributionName
-                DistributionUser = 'root'
-                LinuxCommand = $updateCacheCommand
+                PackageManager = $PackageManager
+                Command = $updateCacheCommand
+                LockTimeout = $LockTimeout
             }
 
-            Invoke-LinuxCommand @updateCacheCommandArguments | Out-Null
+            return (Invoke-PackageTransaction @updateCacheTransactionArguments).lock_wait
         }
         catch {
             throw "Failed to update package cache in WSL distribution '$DistributionName': $($_.Exception.Message)"
@@ -194,7 +317,10 @@ function Install-Package {
         $PackageManager,
 
         [bool]
-        $Force = $false
+        $Force = $false,
+
+        [int]
+        $LockTimeout
     )
 
     if ($PSCmdlet.ShouldProcess($DistributionName, "Install package: $PackageName")) {
@@ -241,38 +367,22 @@ function Install-Package {
                     "DEBCONF_NONINTERACTIVE_SEEN=true " + `
                     "apt-get install -qq $forceFlag $packageSpec"
                 }
-                "dnf" { "LC_ALL=C.UTF-8 dnf install $forceFlag $packageSpec -q &> /dev/null" }
-                "yum" { "LC_ALL=C.UTF-8 yum install $forceFlag $packageSpec -q &> /dev/null" }
+                "dnf" { "LC_ALL=C.UTF-8 dnf install $forceFlag $packageSpec -q" }
+                "yum" { "LC_ALL=C.UTF-8 yum install $forceFlag $packageSpec -q" }
                 "zypper" { "LC_ALL=C.UTF-8 zypper install $forceFlag $packageSpec" }
                 "pacman" { "pacman -S $forceFlag $packageSpec" }
                 "apk" { "apk add $forceFlag $packageSpec" }
                 default { throw "Unsupported package manager: $PackageManager" }
             }
 
-            $installCommandArguments = @{
+            $installTransactionArguments = @{
                 DistributionName = $DistributionName
-                DistributionUser = 'root'
-                LinuxCommand = $installCommand
+                PackageManager = $PackageManager
+                Command = $installCommand
+                LockTimeout = $LockTimeout
             }
 
-            $maxRetries = 5
-            $retryCount = 0
-            $retryIntervalSeconds = 2
-            $success = $false
-
-            while (-not $success -and $retryCount -lt $maxRetries) {
-                try {
-                    Invoke-LinuxCommand @installCommandArguments | Out-Null
-                    $success = $true
-                }
-                catch {
-                    $retryCount++
-                    if ($retryCount -ge $maxRetries) {
-                        throw "Failed to install package '$PackageName' after $maxRetries attempts: $($_.Exception.Message)"
-                    }
-                    Start-Sleep -Seconds $retryIntervalSeconds
-                }
-            }
+            return (Invoke-PackageTransaction @installTransactionArguments).lock_wait
         } catch {
             throw "Failed to install package '$PackageName' in WSL distribution '$DistributionName': $($_.Exception.Message)"
         }
@@ -293,7 +403,10 @@ function Remove-Package {
         $PackageManager,
 
         [bool]
-        $Force = $false
+        $Force = $false,
+
+        [int]
+        $LockTimeout
     )
 
     if ($PSCmdlet.ShouldProcess($DistributionName, "Remove package: $PackageName")) {
@@ -334,13 +447,14 @@ function Remove-Package {
                 default { throw "Unsupported package manager: $PackageManager" }
             }
 
-            $removeCommandArguments = @{
+            $removeTransactionArguments = @{
                 DistributionName = $DistributionName
-                DistributionUser = 'root'
-                LinuxCommand = $removeCommand
+                PackageManager = $PackageManager
+                Command = $removeCommand
+                LockTimeout = $LockTimeout
             }
 
-            Invoke-LinuxCommand @removeCommandArguments | Out-Null
+            return (Invoke-PackageTransaction @removeTransactionArguments).lock_wait
         }
         catch {
             throw "Failed to remove package '$PackageName' in WSL distribution '$DistributionName': $($_.Exception.Message)"
@@ -357,6 +471,7 @@ $package_name = $module.Params.name
 $package_version = $module.Params.version
 $force = $module.Params.force
 $update_cache = $module.Params.update_cache
+$lock_timeout = $module.Params.lock_timeout
 $state = $module.Params.state
 $check_mode = $module.CheckMode
 
@@ -370,15 +485,17 @@ try {
     }
     $package_info = Get-PackageInfo @packageInfoParams
     $module.Diff.before = $package_info
+    $lock_wait = 0
 
     if ($update_cache) {
         $updatePackageCacheParams = @{
             DistributionName = $distribution_name
             PackageManager = $package_manager
+            LockTimeout = $lock_timeout
             WhatIf = $check_mode
         }
 
-        Update-PackageCache @updatePackageCacheParams
+        $lock_wait += Update-PackageCache @updatePackageCacheParams
     }
 
     if ($state -eq 'absent') {
@@ -388,10 +505,11 @@ try {
                 PackageName = $package_name
                 PackageManager = $package_manager
                 Force = $force
+                LockTimeout = $lock_timeout
                 WhatIf = $check_mode
             }
 
-            Remove-Package @removePackageParams
+            $lock_wait += Remove-Package @removePackageParams
             Set-ModuleChanged -Module $module
         }
     } elseif ($state -eq 'present') {
@@ -405,16 +523,18 @@ try {
                 PackageVersion = $package_version
                 PackageManager = $package_manager
                 Force = $force
+                LockTimeout = $lock_timeout
                 WhatIf = $check_mode
             }
 
-            Install-Package @installPackageParams
+            $lock_wait += Install-Package @installPackageParams
             Set-ModuleChanged -Module $module
         }
     }
 
     $package_info = Get-PackageInfo @packageInfoParams
     $module.Diff.after = $package_info
+    $module.Result.lock_wait = $lock_wait
 
 } catch {
     $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
@@ -41,6 +41,14 @@ options:
             - Equivalent to running 'apt-get update', 'dnf check-update', etc. depending on the package manager.
         type: bool
         default: false
+    lock_timeout:
+        description:
+            - Maximum number of seconds to wait for the package manager lock inside the distribution.
+            - The transaction starts as soon as the lock is released, for example by unattended-upgrades.
+            - A transaction failing because another process took the lock in the meantime is retried within the same timeout.
+            - Other failures are reported immediately.
+        type: int
+        default: 300
     state:
         description:
             - Whether the package should be present or absent.
@@ -85,6 +93,14 @@ EXAMPLES = r'''
     name: nginx
     state: absent
 
+- name: Install a package on a fresh distribution, waiting up to 10 minutes for unattended-upgrades
+  wsl_package:
+    distribution: Ubuntu
+    name: nginx
+    update_cache: true
+    lock_timeout: 600
+    state: present
+
 - name: Force installation of a package
   wsl_package:
     distribution: Ubuntu
@@ -104,4 +120,9 @@ EXAMPLES = r'''
 '''
 
 RETURN = r'''
+lock_wait:
+    description: Number of seconds spent waiting for the package manager lock.
+    type: int
+    returned: success
+    sample: 12
 '''
\ No newline at end of file
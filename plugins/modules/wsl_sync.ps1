@@ -0,0 +1,567 @@
+#!powershell
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ..module_utils.Common
+#AnsibleRequires -PowerShell ..module_utils.WSL
+
+$spec = @{
+    options = @{
+        distribution = @{
+            type     = "str"
+            required = $true
+        }
+        src = @{
+            type     = "str"
+            required = $true
+        }
+        dest = @{
+            type     = "str"
+            required = $true
+        }
+        remote_src = @{
+            type     = "bool"
+            default  = $false
+        }
+        delete = @{
+            type     = "bool"
+            default  = $false
+        }
+        checksum = @{
+            type     = "bool"
+            default  = $true
+        }
+        owner = @{
+            type     = "str"
+            required = $false
+        }
+        group = @{
+            type     = "str"
+            required = $false
+        }
+        file_mode = @{
+            type     = "str"
+            required = $false
+        }
+        directory_mode = @{
+            type     = "str"
+            required = $false
+        }
+        # Internal options set by the wsl_sync action plugin
+        _manifest = @{
+            type     = "dict"
+        }
+        _archive = @{
+            type     = "str"
+        }
+        _transfer = @{
+            type     = "list"
+            elements = "str"
+            default  = @()
+        }
+        _remove = @{
+            type     = "list"
+            elements = "str"
+            default  = @()
+        }
+    }
+    supports_check_mode = $true
+}
+
+
+function New-SyncManifest {
+    param(
+        [System.Collections.IDictionary]
+        $Entries = @{}
+    )
+
+    # Linux paths are case sensitive, PowerShell hashtables are not
+    $manifest = New-Object -TypeName 'System.Collections.Generic.Dictionary[string,object]' -ArgumentList @(
+        [System.StringComparer]::Ordinal
+    )
+    foreach ($relativePath in $Entries.Keys) {
+        $manifest[$relativePath] = $Entries[$relativePath]
+    }
+
+    return , $manifest
+}
+
+
+function Get-WSLSyncManifest {
+    param(
+        [string]
+        $DistributionName,
+
+        [string]
+        $Path,
+
+        [bool]
+        $Checksum
+    )
+
+    $checksumCommand = if ($Checksum) { " && find . -type f -exec sha256sum {} +" } else { "" }
+    $manifestCommandArguments = @{
+        DistributionName = $DistributionName
+        DistributionUser = 'root'
+        LinuxCommand = "if [ -d '$Path' ]; then cd '$Path' && find . -mindepth 1 -printf '%y\t%s\t%T@\t%P\0'$checksumCommand; fi"
+    }
+    $output = Invoke-LinuxCommand @manifestCommandArguments
+
+    # Entries end with a NUL so any file name survives, the checksum lines follow the last one
+    $records = $output -split "`0"
+
+    $types = @{ f = 'file'; d = 'directory'; l = 'link' }
+    $manifest = New-SyncManifest
+    foreach ($record in ($records | Select-Object -SkipLast 1)) {
+        $parts = $record -split "`t", 4
+        if ($parts.Count -ne 4) {
+            continue
+        }
+
+        $type = if ($types.ContainsKey($parts[0])) { $types[$parts[0]] } else { 'other' }
+        $mtime = [System.Math]::Floor([double]::Parse($parts[2], [System.Globalization.CultureInfo]::InvariantCulture))
+        $manifest[$parts[3]] = @{
+            type = $type
+            size = [long]$parts[1]
+            mtime = [long]$mtime
+            checksum = $null
+        }
+    }
+
+    $checksums = New-SyncManifest
+    foreach ($line in $records[-1] -split "`n") {
+        if ($line -notmatch '^(\\?)([0-9a-f]{64})  \./(.+)$') {
+            continue
+        }
+
+        # sha256sum escapes a name with a backslash or newline and starts its line with a backslash
+        $hash = $Matches[2]
+        $relativePath = $Matches[3]
+        if ($Matches[1]) {
+            $relativePath = [regex]::Replace($relativePath, '\\(.)', {
+                param($escape)
+                switch -CaseSensitive ($escape.Groups[1].Value) {
+                    'n' { "`n" }
+                    'r' { "`r" }
+                    default { $escape.Groups[1].Value }
+                }
+            })
+        }
+        $checksums[$relativePath] = $hash
+    }
+
+    foreach ($relativePath in $checksums.Keys) {
+        if ($manifest.ContainsKey($relativePath)) {
+            $manifest[$relativePath].checksum = $checksums[$relativePath]
+        }
+    }
+
+    return $manifest
+}
+
+
+function Get-WindowsSyncManifest {
+    param(
+        [string]
+        $Path,
+
+        [bool]
+        $Checksum
+    )
+
+    if (-not (Test-Path -LiteralPath $Path -PathType Container)) {
+        throw "Source directory '$Path' does not exist"
+    }
+
+    $root = (Get-Item -LiteralPath $Path).FullName.TrimEnd('\')
+    $manifest = New-SyncManifest
+
+    foreach ($item in Get-ChildItem -LiteralPath $root -Recurse -Force) {
+        $relativePath = $item.FullName.Substring($root.Length + 1).Replace('\', '/')
+
+        if ($item.PSIsContainer) {
+            $manifest[$relativePath] = @{
+                type = 'directory'
+                size = 0
+                mtime = ([System.DateTimeOffset]$item.LastWriteTimeUtc).ToUnixTimeSeconds()
+                checksum = $null
+                source = $item.FullName
+            }
+            continue
+        }
+
+        $manifest[$relativePath] = @{
+            type = 'file'
+            size = $item.Length
+            mtime = ([System.DateTimeOffset]$item.LastWriteTimeUtc).ToUnixTimeSeconds()
+            checksum = if ($Checksum) { (Get-FileHash -LiteralPath $item.FullName -Algorithm SHA256).Hash.ToLower() } else { $null }
+            source = $item.FullName
+        }
+    }
+
+    return $manifest
+}
+
+
+function Compare-SyncManifest {
+    param(
+        [System.Collections.IDictionary]
+        $Source,
+
+        [System.Collections.IDictionary]
+        $Destination,
+
+        [bool]
+        $Delete,
+
+        [bool]
+        $Checksum
+    )
+
+    $transfer = New-Object -TypeName System.Collections.Generic.List[string]
+    $remove = New-Object -TypeName System.Collections.Generic.List[string]
+
+    foreach ($relativePath in $Source.Keys | Sort-Object) {
+        $wanted = $Source[$relativePath]
+        $current = if ($Destination.ContainsKey($relativePath)) { $Destination[$relativePath] } else { $null }
+
+        # A different kind of entry is in the way, it must go before extracting
+        if ($current -and $current.type -ne $wanted.type) {
+            $remove.Add($relativePath)
+            $current = $null
+        }
+
+        $changed = if (-not $current) {
+            $true
+        } elseif ($wanted.type -eq 'directory') {
+            $false
+        } elseif ($current.size -ne $wanted.size) {
+            $true
+        } elseif ($Checksum) {
+            $current.checksum -ne $wanted.checksum
+        } else {
+            $current.mtime -ne $wanted.mtime
+        }
+
+        if ($changed) {
+            $transfer.Add($relativePath)
+        }
+    }
+
+    if ($Delete) {
+        foreach ($relativePath in $Destination.Keys | Sort-Object) {
+            if (-not $Source.ContainsKey($relativePath)) {
+                $remove.Add($relativePath)
+            }
+        }
+    }
+
+    # Removing a directory already covers everything below it
+    $removedPaths = New-Object -TypeName System.Collections.Generic.HashSet[string]
+    $topLevelRemove = New-Object -TypeName System.Collections.Generic.List[string]
+    foreach ($relativePath in $remove) {
+        $segments = $relativePath -split '/'
+        $covered = $false
+        for ($i = 1; $i -lt $segments.Count; $i++) {
+            if ($removedPaths.Contains(($segments[0..($i - 1)] -join '/'))) {
+                $covered = $true
+                break
+            }
+        }
+
+        [void]$removedPaths.Add($relativePath)
+        if (-not $covered) {
+            $topLevelRemove.Add($relativePath)
+        }
+    }
+
+    return @{
+        transfer = @($transfer)
+        remove = @($topLevelRemove)
+    }
+}
+
+
+function Write-TarEntry {
+    param(
+        [System.IO.Stream]
+        $Stream,
+
+        [string]
+        $Name,
+
+        [string]
+        $SourcePath,
+
+        [bool]
+        $IsDirectory,
+
+        [long]
+        $MTime
+    )
+
+    $encoding = [System.Text.Encoding]::UTF8
+    $entryName = if ($IsDirectory) { "$Name/" } else { $Name }
+    $nameBytes = $encoding.GetBytes($entryName)
+    $size = if ($IsDirectory) { 0 } else { (Get-Item -LiteralPath $SourcePath).Length }
+
+    $newHeader = {
+        param([byte[]]$HeaderName, [char]$TypeFlag, [long]$HeaderSize, [string]$Mode)
+
+        $header = New-Object -TypeName byte[] -ArgumentList 512
+        $putField = {
+            param([int]$Offset, [int]$Length, [byte[]]$Value)
+            [System.Array]::Copy($Value, 0, $header, $Offset, [System.Math]::Min($Value.Length, $Length))
+        }
+        $toOctal = {
+            param([long]$Value, [int]$Length)
+            $encoding.GetBytes([System.Convert]::ToString($Value, 8).PadLeft($Length - 1, '0') + "`0")
+        }
+
+        & $putField 0 100 $HeaderName
+        & $putField 100 8 $encoding.GetBytes("$Mode`0")
+        & $putField 108 8 (& $toOctal 0 8)
+        & $putField 116 8 (& $toOctal 0 8)
+        & $putField 124 12 (& $toOctal $HeaderSize 12)
+        & $putField 136 12 (& $toOctal $MTime 12)
+        & $putField 148 8 $encoding.GetBytes("        ")
+        $header[156] = [byte]$TypeFlag
+        & $putField 257 8 $encoding.GetBytes("ustar  `0")
+
+        $sum = 0
+        foreach ($byte in $header) { $sum += $byte }
+        & $putField 148 8 $encoding.GetBytes([System.Convert]::ToString($sum, 8).PadLeft(6, '0') + "`0 ")
+
+        return , $header
+    }
+
+    $writePadding = {
+        param([long]$Length)
+        $remainder = $Length % 512
+        if ($remainder -ne 0) {
+            $Stream.Write((New-Object -TypeName byte[] -ArgumentList (512 - $remainder)), 0, 512 - $remainder)
+        }
+    }
+
+    # GNU long name extension for names which do not fit in the header
+    if ($nameBytes.Length -gt 100) {
+        $longName = [byte[]]($nameBytes + [byte]0)
+        $longHeader = & $newHeader $encoding.GetBytes("././@LongLink") ([char]'L') $longName.Length "0000644"
+        $Stream.Write($longHeader, 0, 512)
+        $Stream.Write($longName, 0, $longName.Length)
+        & $writePadding $longName.Length
+    }
+
+    $typeFlag = if ($IsDirectory) { [char]'5' } else { [char]'0' }
+    $mode = if ($IsDirectory) { "0000755" } else { "0000644" }
+    $header = & $newHeader $nameBytes $typeFlag $size $mode
+    $Stream.Write($header, 0, 512)
+
+    if (-not $IsDirectory) {
+        $file = [System.IO.File]::OpenRead($SourcePath)
+        try {
+            $file.CopyTo($Stream)
+        }
+        finally {
+            $file.Dispose()
+        }
+        & $writePadding $size
+    }
+}
+
+
+function Remove-WSLSyncEntry {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    param(
+        [string]
+        $DistributionName,
+
+        [string]
+        $Path,
+
+        [string[]]
+        $Entries
+    )
+
+    if ($PSCmdlet.ShouldProcess($DistributionName, "Remove $($Entries.Count) entries below: $Path")) {
+        try {
+            # The entry list goes through stdin, it can be longer than a command line allows
+            $entryBytes = [System.Text.Encoding]::UTF8.GetBytes(($Entries -join "`0") + "`0")
+            $removeCommandArguments = @{
+                DistributionName = $DistributionName
+                DistributionUser = 'root'
+                LinuxCommand = "cd '$Path' && xargs -0 rm -rf --"
+                InputWriter = { param($Stream) $Stream.Write($entryBytes, 0, $entryBytes.Length) }.GetNewClosure()
+            }
+
+            Invoke-LinuxCommandWithInput @removeCommandArguments | Out-Null
+        } catch {
+            throw "Failed to remove entries below '$Path' in WSL distribution '$DistributionName': $($_.Exception.Message)"
+        }
+    }
+}
+
+
+function Send-WSLSyncArchive {
+    [CmdletBinding(SupportsShouldProcess = $true)]
+    param(
+        [string]
+        $DistributionName,
+
+        [string]
+        $Path,
+
+        [scriptblock]
+        $ArchiveWriter
+    )
+
+    if ($PSCmdlet.ShouldProcess($DistributionName, "Extract archive into: $Path")) {
+        try {
+            $extractCommandArguments = @{
+                DistributionName = $DistributionName
+                DistributionUser = 'root'
+                LinuxCommand = "mkdir -p '$Path' && tar -x --no-same-owner -f - -C '$Path'"
+                InputWriter = $ArchiveWriter
+            }
+
+            Invoke-LinuxCommandWithInput @extractCommandArguments | Out-Null
+        } catch {
+            throw "Failed to extract archive into '$Path' in WSL distribution '$DistributionName': $($_.Exception.Message)"
+        }
+    }
+}
+
+######################################### Main ##########################################
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$distribution_name = $module.Params.distribution
+$src = $module.Params.src
+$dest = $module.Params.dest
+$remote_src = $module.Params.remote_src
+$delete = $module.Params.delete
+$checksum = $module.Params.checksum
+$owner = $module.Params.owner
+$group = $module.Params.group
+$file_mode = $module.Params.file_mode
+$directory_mode = $module.Params.directory_mode
+$manifest = $module.Params._manifest
+$archive = $module.Params._archive
+$check_mode = $module.CheckMode
+
+# default group to owner if not specified
+$group = if ($group) {
+    $group
+} else {
+    $owner
+}
+
+try {
+    $module.Result.dest = $dest
+
+    if ($remote_src -or $manifest) {
+        $source_manifest = if ($remote_src) {
+            Get-WindowsSyncManifest -Path $src -Checksum $checksum
+        } else {
+            New-SyncManifest -Entries $manifest
+        }
+
+        $getWSLSyncManifestParams = @{
+            DistributionName = $distribution_name
+            Path = $dest
+            Checksum = $checksum
+        }
+        $dest_manifest = Get-WSLSyncManifest @getWSLSyncManifestParams
+
+        $compareSyncManifestParams = @{
+            Source = $source_manifest
+            Destination = $dest_manifest
+            Delete = $delete
+            Checksum = $checksum
+        }
+        $plan = Compare-SyncManifest @compareSyncManifestParams
+        $transfer = $plan.transfer
+        $remove = $plan.remove
+
+        # The action plugin only asks for the plan, it transfers the archive afterwards
+        if (-not $remote_src) {
+            $module.Result.transfer = $transfer
+            $module.Result.remove = $remove
+            $module.ExitJson()
+        }
+    } else {
+        $transfer = $module.Params._transfer
+        $remove = $module.Params._remove
+    }
+
+    if ($remove) {
+        Remove-WSLSyncEntry -DistributionName $distribution_name -Path $dest -Entries $remove -WhatIf:$check_mode
+        Set-ModuleChanged -Module $module
+    }
+
+    if ($transfer) {
+        $archiveWriter = if ($remote_src) {
+            {
+                param($Stream)
+                foreach ($relativePath in $transfer) {
+                    $entry = $source_manifest[$relativePath]
+                    $writeTarEntryParams = @{
+                        Stream = $Stream
+                        Name = $relativePath
+                        SourcePath = $entry.source
+                        IsDirectory = $entry.type -eq 'directory'
+                        MTime = $entry.mtime
+                    }
+                    Write-TarEntry @writeTarEntryParams
+                }
+                # End of archive marker
+                $Stream.Write((New-Object -TypeName byte[] -ArgumentList 1024), 0, 1024)
+            }
+        } else {
+            {
+                param($Stream)
+                $file = [System.IO.File]::OpenRead($archive)
+                try {
+                    $file.CopyTo($Stream)
+                }
+                finally {
+                    $file.Dispose()
+                }
+            }
+        }
+
+        $sendWSLSyncArchiveParams = @{
+            DistributionName = $distribution_name
+            Path = $dest
+            ArchiveWriter = $archiveWriter
+            WhatIf = $check_mode -or -not ($remote_src -or $archive)
+        }
+        Send-WSLSyncArchive @sendWSLSyncArchiveParams
+        Set-ModuleChanged -Module $module
+    }
+
+    $module.Result.changed_entries = 0
+    if ($owner -or $file_mode -or $directory_mode) {
+        $syncWSLTreeAttributesParams = @{
+            DistributionName = $distribution_name
+            Path = $dest
+            Owner = $owner
+            Group = $group
+            FileMode = $file_mode
+            DirectoryMode = $directory_mode
+            MinDepth = 0
+            WhatIf = $check_mode
+        }
+        $changed_entries = Sync-WSLTreeAttributes @syncWSLTreeAttributesParams
+        $module.Result.changed_entries = $changed_entries
+        if ($changed_entries -gt 0) {
+            Set-ModuleChanged -Module $module
+        }
+    }
+
+    $module.Result.transferred = @($transfer)
+    $module.Result.removed = @($remove)
+
+} catch {
+    $module.FailJson("An error occurred: $($_.Exception.Message)", $_)
+}
+
+$module.ExitJson()
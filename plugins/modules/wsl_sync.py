@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+DOCUMENTATION = r'''
+---
+module: wsl_sync
+short_description: Synchronize a directory tree into WSL distributions
+description:
+    - This module synchronizes the content of a directory into a directory of a WSL distribution.
+    - A manifest of relative path, size, modification time and checksum is built on both sides.
+    - Only new or changed files are transferred, as a single tar stream extracted inside the distribution.
+    - Extraneous files in the destination can optionally be deleted.
+    - Ownership and permissions are applied in bulk to the entries which differ.
+options:
+    distribution:
+        description:
+            - The name of the WSL distribution.
+        type: str
+        required: true
+    src:
+        description:
+            - Path to the source directory. The content of this directory is synchronized into C(dest).
+            - By default the directory is on the Ansible controller, relative paths are looked up in the C(files) directory of the role or playbook.
+            - If C(remote_src=true), the directory is on the Windows host.
+        type: str
+        required: true
+    dest:
+        description:
+            - Path to the destination directory in the WSL distribution.
+            - This should be a Linux-style path. It is created if it does not exist.
+        type: str
+        required: true
+    remote_src:
+        description:
+            - Whether C(src) is a directory on the Windows host instead of the Ansible controller.
+        type: bool
+        default: false
+    delete:
+        description:
+            - Delete files and directories in C(dest) which do not exist in C(src).
+        type: bool
+        default: false
+    checksum:
+        description:
+            - Compare files with the same size by their sha256 checksum.
+            - If false, files with the same size are compared by their modification time only, which avoids reading every file in C(dest).
+        type: bool
+        default: true
+    owner:
+        description:
+            - Owner of C(dest) and every entry below it.
+            - Only entries with a different owner or group are changed.
+        type: str
+        required: false
+    group:
+        description:
+            - Group of C(dest) and every entry below it.
+            - If not specified, defaults to same as owner.
+            - Only used when C(owner) is specified.
+        type: str
+        required: false
+    file_mode:
+        description:
+            - Permission mode of every file below C(dest).
+            - This should be an octal Linux-style mode (e.g., '644').
+            - If not specified, files keep the mode of the source.
+        type: str
+        required: false
+    directory_mode:
+        description:
+            - Permission mode of C(dest) and every directory below it.
+            - This should be an octal Linux-style mode (e.g., '755').
+            - If not specified, directories keep the mode of the source.
+        type: str
+        required: false
+notes:
+    - This module requires PowerShell.
+    - This module requires WSL to be installed and configured.
+    - The distribution requires GNU C(find), C(tar) and C(sha256sum).
+    - Symbolic links in the source are followed, the files they point to are transferred.
+seealso:
+    - module: ansible.posix.synchronize
+    - module: vanduc2514.wsl_automation.wsl_file
+author:
+    - vanduc2514 (vanduc2514@gmail.com)
+'''
+
+EXAMPLES = r'''
+- name: Synchronize configuration files from the controller
+  vanduc2514.wsl_automation.wsl_sync:
+    distribution: Ubuntu
+    src: files/dotfiles
+    dest: /home/user/.config
+    owner: user
+    file_mode: '644'
+    directory_mode: '755'
+
+- name: Mirror scripts from the Windows host and delete extraneous files
+  vanduc2514.wsl_automation.wsl_sync:
+    distribution: Ubuntu
+    src: C:\Scripts
+    remote_src: true
+    dest: /opt/scripts
+    delete: true
+    file_mode: '755'
+
+- name: Compare by size and modification time only
+  vanduc2514.wsl_automation.wsl_sync:
+    distribution: Ubuntu
+    src: files/site
+    dest: /var/www/html
+    checksum: false
+'''
+
+RETURN = r'''
+dest:
+    description: Path to the destination directory.
+    type: str
+    returned: always
+    sample: "/opt/scripts"
+transferred:
+    description: Relative paths of the files and directories transferred into C(dest).
+    type: list
+    elements: str
+    returned: success
+    sample: ["bin", "bin/deploy.sh"]
+removed:
+    description: Relative paths of the entries removed from C(dest).
+    type: list
+    elements: str
+    returned: success
+    sample: ["old.sh"]
+changed_entries:
+    description: Number of entries whose owner, group or mode was changed.
+    type: int
+    returned: success
+    sample: 3
+'''
@@ -47,7 +47,7 @@ function Get-ServiceStatus {
         $isServiceActiveCommandParams = @{
             DistributionName = $DistributionName
             DistributionUser = 'root'
-            LinuxCommand = "systemctl is-active $ServiceName"
+            LinuxCommand = "systemctl is-active $ServiceName || true"
         }
         $active = (Invoke-LinuxCommand @isServiceActiveCommandParams).Trim() -eq 'active'
 
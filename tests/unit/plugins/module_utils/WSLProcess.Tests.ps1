@@ -0,0 +1,166 @@
+# Run with Pester 5 under pwsh, wsl.exe is replaced by wsl-stand-in.sh:
+#   Invoke-Pester tests/unit/plugins/module_utils
+
+BeforeAll {
+    $moduleUtils = Join-Path $PSScriptRoot '../../../../plugins/module_utils'
+    Add-Type -Path (Join-Path $moduleUtils 'WSLProcess.cs')
+    Import-Module (Join-Path $moduleUtils 'WSL.psm1') -Force
+
+    $namespace = 'ansible_collections.vanduc2514.wsl_automation.plugins.module_utils.WSLProcess'
+    $runnerType = [type]"$namespace.WSLProcessRunner"
+    $runnerType::Executable = Join-Path $PSScriptRoot 'wsl-stand-in.sh'
+
+    $distribution = 'Ubuntu-20.04'
+}
+
+Describe 'Invoke-WSLCommand' {
+    It 'decodes UTF-16LE output of wsl.exe' {
+        $output = Invoke-WSLCommand -Arguments @('--list', '--verbose')
+
+        $output | Should -Not -Match "`0"
+        $lines = $output -split "`n"
+        $lines.Count | Should -Be 3
+        $lines[1] | Should -Be '* Ubuntu-20.04    Running         2'
+    }
+
+    It 'fails with the exit code and message of wsl.exe' {
+        { Invoke-WSLCommand -Arguments @('--terminate', 'Debian') } |
+            Should -Throw '*exited with code 255: There is no distribution with the supplied name.*WSL_E_DISTRO_NOT_FOUND*'
+    }
+
+    It 'succeeds when wsl.exe exits with zero' {
+        Invoke-WSLCommand -Arguments @('--terminate', $distribution) | Should -BeNullOrEmpty
+    }
+}
+
+Describe 'Invoke-LinuxCommand' {
+    It 'decodes UTF-8 output of the distribution' {
+        Invoke-LinuxCommand -DistributionName $distribution -LinuxCommand "printf 'h\303\251llo \342\234\223\n'" |
+            Should -Be 'héllo ✓'
+    }
+
+    It 'passes a multi-line command as one argument' {
+        Invoke-LinuxCommand -DistributionName $distribution -LinuxCommand "echo one`necho two" |
+            Should -Be "one`ntwo"
+    }
+
+    It 'fails with the exit code and standard error of the command' {
+        { Invoke-LinuxCommand -DistributionName $distribution -LinuxCommand 'echo out; echo err >&2; exit 3' } |
+            Should -Throw '*exited with code 3: err'
+    }
+
+    It 'fails when the command does not exit within the timeout' {
+        { Invoke-LinuxCommand -DistributionName $distribution -LinuxCommand 'sleep 10' -TimeoutSeconds 1 } |
+            Should -Throw '*did not exit within 1 seconds'
+    }
+
+    It 'fails when the output exceeds the limit' {
+        { Invoke-LinuxCommand -DistributionName $distribution -LinuxCommand 'seq 100000' -MaxOutputBytes 1024 } |
+            Should -Throw '*output exceeded 1024 bytes'
+    }
+}
+
+Describe 'Invoke-LinuxCommandWithInput' {
+    It 'streams standard input to the command' {
+        $data = [byte[]]::new(1MB)
+        $output = Invoke-LinuxCommandWithInput -DistributionName $distribution -LinuxCommand 'wc -c' -InputWriter {
+            param($Stream) $Stream.Write($data, 0, $data.Length)
+        }.GetNewClosure()
+
+        $output.Trim() | Should -Be '1048576'
+    }
+
+    It 'ignores input the command does not read' {
+        $data = [byte[]]::new(1MB)
+        $output = Invoke-LinuxCommandWithInput -DistributionName $distribution -LinuxCommand 'echo done' -InputWriter {
+            param($Stream) $Stream.Write($data, 0, $data.Length)
+        }.GetNewClosure()
+
+        $output | Should -Be 'done'
+    }
+}
+
+Describe 'Invoke-LinuxProcess' {
+    It 'passes arguments without shell quoting' {
+        $argv = @('printf', '%s|', 'two words', '"quoted" $HOME', 'back\slash\', '')
+        $result = Invoke-LinuxProcess -DistributionName $distribution -Argv $argv
+
+        $result.ExitCode | Should -Be 0
+        $result.Stdout | Should -Be 'two words|"quoted" $HOME|back\slash\||'
+    }
+
+    It 'keeps NUL separated output of the distribution as UTF-8' {
+        $result = Invoke-LinuxProcess -DistributionName $distribution -Argv @('printf', 'a\0b\0c\0d\0e\0f\0g\0')
+
+        $result.ExitCode | Should -Be 0
+        $result.Stdout | Should -Be "a`0b`0c`0d`0e`0f`0g`0"
+    }
+
+    It 'returns the exit code instead of failing' {
+        $result = Invoke-LinuxProcess -DistributionName $distribution -Argv @('/bin/sh', '-c', 'exit 4')
+
+        $result.ExitCode | Should -Be 4
+    }
+}
+
+Describe 'Invoke-WSLProcess' {
+    BeforeAll {
+        $linuxArguments = @('--distribution', $distribution, '--user', 'root', '--', '/bin/sh', '-c')
+    }
+
+    It 'returns exit code, stdout and stderr separately' {
+        $result = Invoke-WSLProcess -Arguments ($linuxArguments + '"echo out; echo err >&2; exit 3"')
+
+        $result.ExitCode | Should -Be 3
+        $result.Stdout | Should -Be "out`n"
+        $result.Stderr | Should -Be "err`n"
+        $result.TimedOut | Should -BeFalse
+    }
+
+    It 'kills the process after the timeout' {
+        $elapsed = Measure-Command {
+            $result = Invoke-WSLProcess -Arguments ($linuxArguments + '"sleep 10"') -TimeoutSeconds 1
+        }
+
+        $result.TimedOut | Should -BeTrue
+        $elapsed.TotalSeconds | Should -BeLessThan 8
+    }
+
+    It 'keeps reading past the output limit' {
+        $result = Invoke-WSLProcess -Arguments ($linuxArguments + "`"head -c 1000000 /dev/zero | tr '\000' a`"") -MaxOutputBytes 1024
+
+        $result.ExitCode | Should -Be 0
+        $result.Stdout.Length | Should -Be 1024
+        $result.StdoutTruncated | Should -BeTrue
+        $result.StderrTruncated | Should -BeFalse
+    }
+
+    It 'streams stdout as is to the output sink' {
+        $memory = [System.IO.MemoryStream]::new()
+        $hashing = New-Object -TypeName "$namespace.HashingStream" -ArgumentList @(
+            $memory, [System.Security.Cryptography.SHA256]::Create()
+        )
+        $result = Invoke-WSLProcess -Arguments ($linuxArguments + '"printf abc"') -OutputSink $hashing
+        $hashing.Dispose()
+
+        $result.ExitCode | Should -Be 0
+        $result.Stdout | Should -BeNullOrEmpty
+        $hashing.Length | Should -Be 3
+        $hashing.Hash | Should -Be 'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'
+    }
+
+    It 'pipes the output sink through an external compressor' {
+        $memory = [System.IO.MemoryStream]::new()
+        $compressor = New-Object -TypeName "$namespace.CompressorStream" -ArgumentList @($memory, 'gzip', '-c')
+        $result = Invoke-WSLProcess -Arguments ($linuxArguments + '"seq 100000"') -OutputSink $compressor
+        $compressor.Dispose()
+
+        $compressed = [System.IO.MemoryStream]::new($memory.ToArray())
+        $reader = [System.IO.StreamReader]::new([System.IO.Compression.GZipStream]::new($compressed, [System.IO.Compression.CompressionMode]::Decompress))
+        $lines = $reader.ReadToEnd().TrimEnd("`n") -split "`n"
+
+        $result.ExitCode | Should -Be 0
+        $lines.Count | Should -Be 100000
+        $lines[-1] | Should -Be '100000'
+    }
+}
@@ -0,0 +1,38 @@
+#!/bin/sh
+# Stand-in for wsl.exe. Messages of wsl.exe itself are written in UTF-16LE like the
+# real one unless WSL_UTF8=1, commands after "--" or "--exec" are run as is so their
+# output stays UTF-8.
+
+utf16() {
+    if [ "$WSL_UTF8" = 1 ]; then
+        printf '%s\r\n' "$@"
+    else
+        printf '%s\r\n' "$@" | iconv -f UTF-8 -t UTF-16LE
+    fi
+}
+
+case "$1" in
+    --list)
+        utf16 '  NAME            STATE           VERSION' \
+              '* Ubuntu-20.04    Running         2' \
+              '  Debian          Stopped         2'
+        ;;
+    --terminate)
+        if [ "$2" != "Ubuntu-20.04" ]; then
+            utf16 'There is no distribution with the supplied name.' \
+                  'Error code: Wsl/Service/WSL_E_DISTRO_NOT_FOUND'
+            exit 255
+        fi
+        ;;
+    --distribution)
+        while [ "$#" -gt 0 ] && [ "$1" != "--" ] && [ "$1" != "--exec" ]; do
+            shift
+        done
+        shift
+        exec "$@"
+        ;;
+    *)
+        utf16 "Invalid command line argument: $1"
+        exit 255
+        ;;
+esac